@@ -27,6 +27,7 @@ from simulator.core.peripheral import BasePeripheral
 
 # New architecture
 from simulator.core.register import (
+    MaskedWriteRegister,
     ReadOnlyRegister,
     Register,
     RegisterDescriptor,
@@ -41,6 +42,7 @@ __all__ = [
     # Register abstractions
     "Register",
     "SimpleRegister",
+    "MaskedWriteRegister",
     "ReadOnlyRegister",
     "WriteOnlyRegister",
     "RegisterFile",
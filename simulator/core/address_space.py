@@ -7,10 +7,26 @@ trying to dispatch everything.
 
 from __future__ import annotations
 
+import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from simulator.core.exceptions import MemoryAccessError, MemoryBoundsError
+from simulator.utils.consts import ConstUtils
+
+# Little-endian codecs and value masks for the common access sizes. struct
+# reads/writes the bytearray in place, with no slice copy per access; other
+# sizes fall back to int.from_bytes / to_bytes.
+_SIZE_STRUCTS: dict[int, struct.Struct] = {
+    1: struct.Struct("<B"),
+    2: struct.Struct("<H"),
+    4: struct.Struct("<I"),
+}
+_SIZE_MASKS: dict[int, int] = {
+    1: ConstUtils.MASK_8_BITS,
+    2: ConstUtils.MASK_16_BITS,
+    4: ConstUtils.MASK_32_BITS,
+}
 
 
 @dataclass(frozen=True)
@@ -36,6 +52,10 @@ class MemoryRegion(ABC):
     def __init__(self, address_range: AddressRange, name: str):
         self.range = address_range
         self.name = name
+        # Plain-int bounds so the per-access range check skips the
+        # AddressRange method calls and property lookups.
+        self._base = address_range.base
+        self._end = address_range.base + address_range.size
 
     @property
     def base(self) -> int:
@@ -80,9 +100,12 @@ class FlashMemory(MemoryRegion):
         self._data[: len(data)] = data
 
     def read(self, address: int, size: int) -> int:
-        if not self.range.contains_range(address, size):
+        if not self._base <= address < self._end or address + size > self._end:
             raise MemoryBoundsError(address, size, self.name)
-        offset = address - self.base
+        offset = address - self._base
+        codec = _SIZE_STRUCTS.get(size)
+        if codec is not None:
+            return codec.unpack_from(self._data, offset)[0]
         return int.from_bytes(self._data[offset : offset + size], "little")
 
     def write(self, address: int, size: int, value: int) -> None:
@@ -92,9 +115,9 @@ class FlashMemory(MemoryRegion):
 
     def read_block(self, address: int, size: int) -> bytes:
         """Read a contiguous block of flash (used for boot)."""
-        if not self.range.contains_range(address, size):
+        if not self._base <= address < self._end or address + size > self._end:
             raise MemoryBoundsError(address, size, self.name)
-        offset = address - self.base
+        offset = address - self._base
         return bytes(self._data[offset : offset + size])
 
     def reset(self) -> None:
@@ -109,23 +132,30 @@ class RamMemory(MemoryRegion):
         self._data = bytearray(address_range.size)
 
     def read(self, address: int, size: int) -> int:
-        if not self.range.contains_range(address, size):
+        if not self._base <= address < self._end or address + size > self._end:
             raise MemoryBoundsError(address, size, self.name)
-        offset = address - self.base
+        offset = address - self._base
+        codec = _SIZE_STRUCTS.get(size)
+        if codec is not None:
+            return codec.unpack_from(self._data, offset)[0]
         return int.from_bytes(self._data[offset : offset + size], "little")
 
     def write(self, address: int, size: int, value: int) -> None:
-        if not self.range.contains_range(address, size):
+        if not self._base <= address < self._end or address + size > self._end:
             raise MemoryBoundsError(address, size, self.name)
+        offset = address - self._base
+        codec = _SIZE_STRUCTS.get(size)
+        if codec is not None:
+            codec.pack_into(self._data, offset, value & _SIZE_MASKS[size])
+            return
         mask = (1 << (size * 8)) - 1
-        offset = address - self.base
         self._data[offset : offset + size] = (value & mask).to_bytes(size, "little")
 
     def read_block(self, address: int, size: int) -> bytes:
         """Read a contiguous block of RAM."""
-        if not self.range.contains_range(address, size):
+        if not self._base <= address < self._end or address + size > self._end:
             raise MemoryBoundsError(address, size, self.name)
-        offset = address - self.base
+        offset = address - self._base
         return bytes(self._data[offset : offset + size])
 
     def reset(self) -> None:
@@ -152,6 +182,11 @@ class BitBandRegion(MemoryRegion):
         super().__init__(alias_range, f"BITBAND[{target_range.base:08X}]")
         self.target = target_range
         self.target_is_peripheral = target_is_peripheral
+        # Window bounds as plain ints for translate(), which runs per access
+        self._alias_base = alias_range.base
+        self._alias_end = alias_range.base + alias_range.size
+        self._target_base = target_range.base
+        self._target_end = target_range.base + target_range.size
 
     def translate(self, alias_address: int) -> tuple[int, int]:
         """Convert alias address to (target_address, bit_index).
@@ -159,18 +194,16 @@ class BitBandRegion(MemoryRegion):
         ARM bitband: alias offset = (byte_offset * 32) + (bit_index * 4)
         So: byte_offset = alias_offset // 32, bit_index = (alias_offset % 32) // 4
         """
-        if not self.range.contains(alias_address):
+        if not self._alias_base <= alias_address < self._alias_end:
             raise MemoryBoundsError(alias_address, 4, self.name)
 
-        alias_offset = alias_address - self.base
-        byte_offset = (alias_offset // 32) * 4
-        bit_index = (alias_offset % 32) // 4
-        target_address = self.target.base + byte_offset
+        alias_offset = alias_address - self._alias_base
+        target_address = self._target_base + ((alias_offset >> 5) << 2)
 
-        if not self.target.contains(target_address):
+        if not self._target_base <= target_address < self._target_end:
             raise MemoryBoundsError(alias_address, 4, f"{self.name} -> invalid target")
 
-        return target_address, bit_index
+        return target_address, (alias_offset & 31) >> 2
 
     def read(self, address: int, size: int) -> int:
         raise RuntimeError(
@@ -37,11 +37,12 @@ class BoardRegistry:
 
     def get(self, name: str) -> Type[Board]:
         """Get a board class by name."""
-        if name not in self._boards:
+        board_class = self._boards.get(name)
+        if board_class is None:
             raise ValueError(
                 f"Unknown board '{name}'. Available: {list(self._boards.keys())}"
             )
-        return self._boards[name]
+        return board_class
 
     def list_boards(self) -> list[str]:
         """List all registered board names."""
@@ -5,6 +5,8 @@ boards. It encodes the common patterns (memory setup, hooking, etc.)
 in reusable functions.
 """
 
+from typing import Iterable
+
 from simulator.core.address_space import (
     AddressRange,
     BitBandRegion,
@@ -12,9 +14,13 @@ from simulator.core.address_space import (
     PeripheralWindow,
     RamMemory,
 )
+from simulator.core.clock import Clock
 from simulator.core.cpu import CortexM, UnicornEngine
+from simulator.core.interrupt_controller import InterruptController
 from simulator.core.memmap import AddressSpace, BaseMemoryMap
-from simulator.utils.config_loader import MemoryConfig
+from simulator.core.peripheral import needs_clock_tick
+from simulator.interfaces.peripheral import Peripheral
+from simulator.utils.config_loader import MemoryConfig, PinsConfig
 
 
 def create_address_space_from_config(mem_config: MemoryConfig) -> AddressSpace:
@@ -82,3 +88,40 @@ def create_cpu_for_address_space(address_space: AddressSpace) -> CortexM:
     )
 
     return cpu
+
+
+def gpio_data_mask(pins: PinsConfig) -> int:
+    """Return the GPIO data mask for a board's pin configuration.
+
+    Raises:
+        ValueError: If no pin masks are configured
+    """
+    mask = pins.data_mask
+    if mask == 0:
+        raise ValueError("GPIO pin mask is empty; check config.pins.pin_masks")
+    return mask
+
+
+def wire_clock_and_interrupts(
+    clock: Clock,
+    interrupt_ctrl: InterruptController,
+    cpu: CortexM,
+    peripherals: Iterable[Peripheral],
+) -> None:
+    """Subscribe the CPU and peripherals to the clock and interrupt controller.
+
+    Only peripherals with real timed state are ticked; every peripheral is
+    registered as an interrupt source.
+
+    Args:
+        clock: Board clock
+        interrupt_ctrl: Board interrupt controller
+        cpu: CPU to tick alongside the peripherals
+        peripherals: All board peripherals
+    """
+    peripherals = list(peripherals)
+    clock.subscribe_many([cpu, *(p for p in peripherals if needs_clock_tick(p))])
+    for periph in peripherals:
+        if hasattr(periph, "attach_interrupt_controller"):
+            periph.attach_interrupt_controller(interrupt_ctrl)
+    interrupt_ctrl.subscribe_many(peripherals)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Callable, List
+import inspect
+from functools import partial
+from typing import Callable, Iterable, List, Optional
 
 from simulator.interfaces.clock import ClockSubscriber, IClock
 
@@ -16,6 +18,9 @@ class Clock(IClock):
         self._frequency = frequency
         self._cycle_count = 0
         self._subscribers: List[ClockSubscriber] = []
+        # Resolved per-subscriber callables taking ``cycles``; rebuilt on
+        # (un)subscribe so tick() does no attribute lookups per subscriber.
+        self._dispatch: tuple[Callable[[int], None], ...] = ()
 
     @property
     def frequency(self) -> int:
@@ -28,37 +33,61 @@ class Clock(IClock):
     def subscribe(self, subscriber: ClockSubscriber) -> None:
         if subscriber not in self._subscribers:
             self._subscribers.append(subscriber)
+            self._rebuild_dispatch()
+
+    def subscribe_many(self, subscribers: Iterable[ClockSubscriber]) -> None:
+        """Subscribe several components, rebuilding the dispatch tuple once."""
+        added = False
+        for subscriber in subscribers:
+            if subscriber not in self._subscribers:
+                self._subscribers.append(subscriber)
+                added = True
+        if added:
+            self._rebuild_dispatch()
 
     def unsubscribe(self, subscriber: ClockSubscriber) -> None:
         if subscriber in self._subscribers:
             self._subscribers.remove(subscriber)
+            self._rebuild_dispatch()
 
-    def _validate_cycles(self, cycles: int) -> None:
-        if cycles < 0:
-            raise ValueError("cycles must be >= 0")
+    def _rebuild_dispatch(self) -> None:
+        resolved = (self._resolve_tick(sub) for sub in self._subscribers)
+        self._dispatch = tuple(fn for fn in resolved if fn is not None)
 
-    def _repeat_call(self, fn: Callable[[], None], cycles: int) -> None:
-        for _ in range(cycles):
-            fn()
+    def _resolve_tick(
+        self, subscriber: ClockSubscriber
+    ) -> Optional[Callable[[int], None]]:
+        tick_fn = getattr(subscriber, "tick", None)
+        if callable(tick_fn):
+            if self._accepts_cycles(tick_fn):
+                return tick_fn
+            return partial(self._repeat_call, tick_fn)
+
+        step_fn = getattr(subscriber, "step", None)
+        if callable(step_fn):
+            return partial(self._repeat_call, step_fn)
+        return None
 
-    def _call_with_cycles(self, tick_fn: Callable[[int], None], cycles: int) -> bool:
+    @staticmethod
+    def _accepts_cycles(fn: Callable[..., None]) -> bool:
+        """Whether fn can be called with a cycle count, decided once up front."""
         try:
-            tick_fn(cycles)
+            signature = inspect.signature(fn)
+        except (TypeError, ValueError):
+            return True  # No introspectable signature; assume tick(cycles)
+        try:
+            signature.bind(1)
         except TypeError:
             return False
         return True
 
-    def _notify_subscriber(self, subscriber: ClockSubscriber, cycles: int) -> None:
-        tick_fn = getattr(subscriber, "tick", None)
-        if callable(tick_fn):
-            if self._call_with_cycles(tick_fn, cycles):
-                return
-            self._repeat_call(tick_fn, cycles)
-            return
+    def _validate_cycles(self, cycles: int) -> None:
+        if cycles < 0:
+            raise ValueError("cycles must be >= 0")
 
-        step_fn = getattr(subscriber, "step", None)
-        if callable(step_fn):
-            self._repeat_call(step_fn, cycles)
+    def _repeat_call(self, fn: Callable[..., None], cycles: int) -> None:
+        for _ in range(cycles):
+            fn()
 
     def tick(self, cycles: int = 1) -> None:
         self._validate_cycles(cycles)
@@ -67,9 +96,10 @@ class Clock(IClock):
 
         self._cycle_count += cycles
 
-        # Notify subscribers once per tick batch
-        for subscriber in list(self._subscribers):
-            self._notify_subscriber(subscriber, cycles)
+        # Notify subscribers once per tick batch; subscribers without a
+        # cycle count were wrapped to repeat once per cycle at subscribe time.
+        for tick_fn in self._dispatch:
+            tick_fn(cycles)
 
     def reset(self) -> None:
         self._cycle_count = 0
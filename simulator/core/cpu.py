@@ -85,6 +85,38 @@ _ARM_REG_MAP = {
 }
 
 _XPSR_THUMB_BIT = 0x01000000
+
+# (name, unicorn register, group) rows reported by get_snapshot(); built once
+_SNAPSHOT_REGISTERS: tuple[tuple[str, int, str], ...] = (
+    ("R0", UC_ARM_REG_R0, "GPR"),
+    ("R1", UC_ARM_REG_R1, "GPR"),
+    ("R2", UC_ARM_REG_R2, "GPR"),
+    ("R3", UC_ARM_REG_R3, "GPR"),
+    ("R4", UC_ARM_REG_R4, "GPR"),
+    ("R5", UC_ARM_REG_R5, "GPR"),
+    ("R6", UC_ARM_REG_R6, "GPR"),
+    ("R7", UC_ARM_REG_R7, "GPR"),
+    ("R8", UC_ARM_REG_R8, "GPR"),
+    ("R9", UC_ARM_REG_R9, "GPR"),
+    ("R10", UC_ARM_REG_R10, "GPR"),
+    ("R11", UC_ARM_REG_R11, "GPR"),
+    ("R12", UC_ARM_REG_R12, "GPR"),
+    ("SP", UC_ARM_REG_SP, "SP/PC"),
+    ("LR", UC_ARM_REG_LR, "SP/PC"),
+    ("PC", UC_ARM_REG_PC, "SP/PC"),
+    ("XPSR", UC_ARM_REG_XPSR, "STATUS"),
+    ("MSP", UC_ARM_REG_MSP, "STATUS"),
+)
+
+# XPSR condition/status flag bits exposed in snapshots
+_XPSR_FLAG_BITS: tuple[tuple[str, int], ...] = (
+    ("N", 1 << 31),
+    ("Z", 1 << 30),
+    ("C", 1 << 29),
+    ("V", 1 << 28),
+    ("Q", 1 << 27),
+    ("T", 1 << 24),
+)
 _PC_THUMB_MASK = 0xFFFFFFFE
 
 
@@ -94,6 +126,8 @@ class UnicornEngine:
     This isolates Unicorn-specific code so it can be replaced/tested easily.
     """
 
+    __slots__ = ("uc",)
+
     def __init__(self):
         if not UNICORN_AVAILABLE:
             raise ImportError("Unicorn is required. Install: pip install unicorn")
@@ -144,6 +178,8 @@ class CortexM(ICPU):
     replaceable.
     """
 
+    __slots__ = ("engine", "address_space", "_pending_interrupts")
+
     def __init__(self, engine: UnicornEngine, address_space: AddressSpace):
         """Initialize CPU with pre-configured engine and address space.
 
@@ -232,41 +268,14 @@ class CortexM(ICPU):
 
     def get_snapshot(self) -> CpuSnapshot:
         """Return a snapshot of CPU registers and flags for debug/GUI."""
-        reg_defs = [
-            ("R0", UC_ARM_REG_R0, "GPR"),
-            ("R1", UC_ARM_REG_R1, "GPR"),
-            ("R2", UC_ARM_REG_R2, "GPR"),
-            ("R3", UC_ARM_REG_R3, "GPR"),
-            ("R4", UC_ARM_REG_R4, "GPR"),
-            ("R5", UC_ARM_REG_R5, "GPR"),
-            ("R6", UC_ARM_REG_R6, "GPR"),
-            ("R7", UC_ARM_REG_R7, "GPR"),
-            ("R8", UC_ARM_REG_R8, "GPR"),
-            ("R9", UC_ARM_REG_R9, "GPR"),
-            ("R10", UC_ARM_REG_R10, "GPR"),
-            ("R11", UC_ARM_REG_R11, "GPR"),
-            ("R12", UC_ARM_REG_R12, "GPR"),
-            ("SP", UC_ARM_REG_SP, "SP/PC"),
-            ("LR", UC_ARM_REG_LR, "SP/PC"),
-            ("PC", UC_ARM_REG_PC, "SP/PC"),
-            ("XPSR", UC_ARM_REG_XPSR, "STATUS"),
-            ("MSP", UC_ARM_REG_MSP, "STATUS"),
-        ]
-
-        registers = [
-            RegisterValue(name, self.engine.get_register(reg), group)
-            for name, reg, group in reg_defs
-        ]
-
-        xpsr = self.engine.get_register(UC_ARM_REG_XPSR)
-        flags = {
-            "N": bool(xpsr & (1 << 31)),
-            "Z": bool(xpsr & (1 << 30)),
-            "C": bool(xpsr & (1 << 29)),
-            "V": bool(xpsr & (1 << 28)),
-            "Q": bool(xpsr & (1 << 27)),
-            "T": bool(xpsr & (1 << 24)),
-        }
+        get_register = self.engine.get_register
+        registers = tuple(
+            RegisterValue(name, get_register(reg), group)
+            for name, reg, group in _SNAPSHOT_REGISTERS
+        )
+
+        xpsr = get_register(UC_ARM_REG_XPSR)
+        flags = {name: bool(xpsr & bit) for name, bit in _XPSR_FLAG_BITS}
 
         return CpuSnapshot(registers=registers, flags=flags)
 
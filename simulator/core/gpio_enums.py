@@ -5,6 +5,7 @@ GPIO implementations across all boards.
 """
 
 from enum import IntEnum
+from typing import Final
 
 
 class PinMode(IntEnum):
@@ -41,3 +42,20 @@ class PinLevel(IntEnum):
 
     HIGH = 1
     """Logic level HIGH (typically 3.3V or 5V, digital 1)."""
+
+
+# Plain-int aliases for hot paths. Enum member access goes through the enum
+# metaclass; these are ordinary module globals that compare equal to the
+# corresponding members. Keep the enums for user-facing APIs.
+INPUT_INT: Final[int] = int(PinMode.INPUT)
+OUTPUT_INT: Final[int] = int(PinMode.OUTPUT)
+INPUT_PULLUP_INT: Final[int] = int(PinMode.INPUT_PULLUP)
+INPUT_PULLDOWN_INT: Final[int] = int(PinMode.INPUT_PULLDOWN)
+ALTERNATE_INT: Final[int] = int(PinMode.ALTERNATE)
+
+LOW_INT: Final[int] = int(PinLevel.LOW)
+HIGH_INT: Final[int] = int(PinLevel.HIGH)
+
+# Bit value (0/1) -> PinLevel member, so converting a sampled bit is a tuple
+# index rather than a PinLevel(...) call through EnumMeta.__call__
+PIN_LEVELS: Final[tuple[PinLevel, PinLevel]] = (PinLevel.LOW, PinLevel.HIGH)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from simulator.interfaces.clock import IClock
 from simulator.interfaces.interrupt_controller import (
@@ -25,6 +25,11 @@ class InterruptController(IInterruptController):
         if peripheral not in self._subscribers:
             self._subscribers.append(peripheral)
 
+    def subscribe_many(self, peripherals: Iterable[object]) -> None:
+        """Register several interrupt sources in one call."""
+        for peripheral in peripherals:
+            self.subscribe(peripheral)
+
     def attach_cpu(self, cpu: InterruptTarget) -> None:
         self._cpu = cpu
 
@@ -36,5 +41,9 @@ class InterruptController(IInterruptController):
             self._cpu.handle_interrupt(event)
         return event
 
+    def has_pending(self) -> bool:
+        """Return True if any interrupt event is queued (O(1), no scan)."""
+        return bool(self._pending)
+
     def reset(self) -> None:
         self._pending.clear()
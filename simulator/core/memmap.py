@@ -7,7 +7,7 @@ This is much simpler than the old MemoryBus because each region owns its behavio
 from __future__ import annotations
 
 import bisect
-from typing import Optional
+from typing import Callable, Iterable, Optional, cast
 
 from simulator.core.address_space import (
     AddressRange,
@@ -25,6 +25,22 @@ from simulator.core.exceptions import (
 from simulator.interfaces.memory_map import IMemoryMap
 from simulator.interfaces.peripheral import Peripheral
 
+# Single-bit masks indexed by bit number (bit-band alias accesses)
+_BIT_MASKS: tuple[int, ...] = tuple(1 << bit for bit in range(32))
+
+# Peripheral lookup TLB: direct-mapped, 1 KiB pages (smallest GPIO port span)
+_TLB_PAGE_SHIFT = 10
+_TLB_SLOTS = 64
+
+# Alignment masks keyed by access size; unsupported sizes are absent
+_ALIGN_MASKS: dict[int, int] = {1: 0, 2: 1, 4: 3}
+
+# Region kinds in the flattened read/write dispatch table
+_REGION_BITBAND = 0
+_REGION_FLASH = 1
+_REGION_SRAM = 2
+_REGION_MMIO = 3
+
 
 class PeripheralMapping:
     """Represents a single peripheral at a base address."""
@@ -32,6 +48,7 @@ class PeripheralMapping:
     def __init__(self, base: int, size: int, peripheral: Peripheral):
         self.base = base
         self.size = size
+        self.end = base + size
         self.range = AddressRange(base, size)
         self.peripheral = peripheral
 
@@ -58,6 +75,28 @@ class AddressSpace(IMemoryMap):
         # Peripheral registry for MMIO dispatch
         self._peripherals: dict[int, PeripheralMapping] = {}
         self._periph_bases: list[int] = []
+        # Mappings in the same (base-sorted) order as _periph_bases, so a
+        # bisect index selects the mapping without a dict lookup
+        self._periph_sorted: list[PeripheralMapping] = []
+        # Bound reset() of every peripheral, in registration order, so reset()
+        # is a flat call loop rather than a dict walk plus method lookups
+        self._periph_resets: list[Callable[[], None]] = []
+
+        # Software TLB over find_peripheral(). Only hits are cached and every
+        # hit is bounds-checked, so entries never need invalidating (mappings
+        # are never removed and registrations cannot overlap).
+        self._tlb: list[PeripheralMapping | None] = [None] * _TLB_SLOTS
+
+        # Non-overlapping, base-sorted view of the regions for read/write:
+        # one bisect replaces a chain of contains() probes per access
+        self._region_starts: list[int] = []
+        self._region_table: list[tuple[int, int, MemoryRegion]] = []
+        self._build_region_table()
+
+        # L1 in front of read/write for MMIO: page slot -> peripheral mapping.
+        # Filled only with mappings lying wholly inside an MMIO span, so a hit
+        # skips region classification without changing dispatch priority.
+        self._mmio_l1: list[PeripheralMapping | None] = [None] * _TLB_SLOTS
 
     def register_peripheral(self, base: int, size: int, peripheral: Peripheral) -> None:
         """Register a peripheral at a given base address.
@@ -75,8 +114,7 @@ class AddressSpace(IMemoryMap):
 
         # Check overlap with previous peripheral
         if idx > 0:
-            prev_base = self._periph_bases[idx - 1]
-            prev = self._peripherals[prev_base]
+            prev = self._periph_sorted[idx - 1]
             if base < prev.base + prev.size:
                 raise ValueError(
                     f"Peripheral overlap at 0x{base:08X} with existing "
@@ -94,19 +132,63 @@ class AddressSpace(IMemoryMap):
 
         mapping = PeripheralMapping(base, size, peripheral)
         self._periph_bases.insert(idx, base)
+        self._periph_sorted.insert(idx, mapping)
         self._peripherals[base] = mapping
+        self._periph_resets.append(peripheral.reset)
+
+    def register_peripherals(
+        self, entries: Iterable[tuple[int, int, Peripheral]]
+    ) -> None:
+        """Register several (base, size, peripheral) entries at once.
+
+        The whole batch is validated against itself and the existing
+        registry before anything is added, so an overlap leaves the address
+        space unchanged. The sorted lookup index is rebuilt once.
+
+        Raises ValueError if any peripherals would overlap.
+        """
+        new_mappings = []
+        for base, size, peripheral in entries:
+            if size <= 0:
+                raise ValueError("Peripheral size must be > 0")
+            if not self.mmio.range.contains_range(base, size):
+                raise MemoryBoundsError(base, size, "MMIO")
+            new_mappings.append(PeripheralMapping(base, size, peripheral))
+
+        merged = sorted(self._periph_sorted + new_mappings, key=lambda m: m.base)
+        for prev, mapping in zip(merged, merged[1:]):
+            if mapping.base < prev.end:
+                raise ValueError(
+                    f"Peripheral overlap at 0x{mapping.base:08X} with existing "
+                    f"peripheral at 0x{prev.base:08X}-0x{prev.end:08X}"
+                )
+
+        self._periph_sorted = merged
+        self._periph_bases = [mapping.base for mapping in merged]
+        for mapping in new_mappings:
+            self._peripherals[mapping.base] = mapping
+            self._periph_resets.append(mapping.peripheral.reset)
 
     def find_peripheral(self, address: int) -> Optional[PeripheralMapping]:
         """Find the peripheral containing this address."""
-        if not self._periph_bases:
-            return None
-
-        # Binary search
+        slot = (address >> _TLB_PAGE_SHIFT) & (_TLB_SLOTS - 1)
+        mapping = self._tlb[slot]
+        if mapping is not None and mapping.base <= address < mapping.end:
+            return mapping
+
+        mapping = self._search_peripheral(address)
+        if mapping is not None:
+            self._tlb[slot] = mapping
+        return mapping
+
+    def _search_peripheral(self, address: int) -> Optional[PeripheralMapping]:
+        """Binary-search the peripheral registry (TLB miss path)."""
+        # Last base <= address; registrations never overlap, so only that
+        # mapping's end needs checking
         idx = bisect.bisect_right(self._periph_bases, address) - 1
         if idx >= 0:
-            base = self._periph_bases[idx]
-            mapping = self._peripherals[base]
-            if mapping.range.contains(address):
+            mapping = self._periph_sorted[idx]
+            if address < mapping.end:
                 return mapping
 
         return None
@@ -120,63 +202,79 @@ class AddressSpace(IMemoryMap):
 
     def read(self, address: int, size: int) -> int:
         """Read from the address space."""
-        self._validate_access(address, size)
+        align = _ALIGN_MASKS.get(size)
+        if align is None:
+            raise MemoryAccessError(
+                address, message="Access size must be 1, 2, or 4 bytes"
+            )
+        if address & align:
+            raise MemoryAlignmentError(address, size)
 
-        # Check bitband
-        for bb in self.bitband_regions:
-            if bb.contains(address):
-                if size != 4:
+        slot = (address >> _TLB_PAGE_SHIFT) & (_TLB_SLOTS - 1)
+        mapping = self._mmio_l1[slot]
+        if mapping is not None and mapping.base <= address < mapping.end:
+            return mapping.peripheral.read(address - mapping.base, size)
+
+        idx = bisect.bisect_right(self._region_starts, address) - 1
+        if idx >= 0:
+            end, kind, region = self._region_table[idx]
+            if address < end:
+                if kind == _REGION_MMIO:
+                    mapping = self._find_mmio_peripheral(address, slot, idx)
+                    if mapping:
+                        offset = address - mapping.base
+                        return mapping.peripheral.read(offset, size)
                     raise MemoryAccessError(
-                        address, message="Bitband accesses must be 4 bytes"
+                        address, message="No peripheral at this address"
                     )
-                return self._bitband_read(bb, address)
-
-        # Check standard regions
-        if self.flash.contains(address):
-            return self.flash.read(address, size)
-        if self.sram.contains(address):
-            return self.sram.read(address, size)
-
-        # Check peripherals
-        if self.mmio.contains(address):
-            mapping = self.find_peripheral(address)
-            if mapping:
-                offset = address - mapping.base
-                return mapping.peripheral.read(offset, size)
-            raise MemoryAccessError(address, message="No peripheral at this address")
+                if kind == _REGION_BITBAND:
+                    if size != 4:
+                        raise MemoryAccessError(
+                            address, message="Bitband accesses must be 4 bytes"
+                        )
+                    return self._bitband_read(cast(BitBandRegion, region), address)
+                return region.read(address, size)
 
         raise MemoryAccessError(address, message="Address not mapped")
 
     def write(self, address: int, size: int, value: int) -> None:
         """Write to the address space."""
-        self._validate_access(address, size)
-
-        # Check bitband
-        for bb in self.bitband_regions:
-            if bb.contains(address):
-                if size != 4:
-                    raise MemoryAccessError(
-                        address, message="Bitband accesses must be 4 bytes"
-                    )
-                self._bitband_write(bb, address, value)
-                return
+        align = _ALIGN_MASKS.get(size)
+        if align is None:
+            raise MemoryAccessError(
+                address, message="Access size must be 1, 2, or 4 bytes"
+            )
+        if address & align:
+            raise MemoryAlignmentError(address, size)
 
-        # Check standard regions
-        if self.flash.contains(address):
-            self.flash.write(address, size, value)
-            return
-        if self.sram.contains(address):
-            self.sram.write(address, size, value)
+        slot = (address >> _TLB_PAGE_SHIFT) & (_TLB_SLOTS - 1)
+        mapping = self._mmio_l1[slot]
+        if mapping is not None and mapping.base <= address < mapping.end:
+            mapping.peripheral.write(address - mapping.base, size, value)
             return
 
-        # Check peripherals
-        if self.mmio.contains(address):
-            mapping = self.find_peripheral(address)
-            if mapping:
-                offset = address - mapping.base
-                mapping.peripheral.write(offset, size, value)
+        idx = bisect.bisect_right(self._region_starts, address) - 1
+        if idx >= 0:
+            end, kind, region = self._region_table[idx]
+            if address < end:
+                if kind == _REGION_MMIO:
+                    mapping = self._find_mmio_peripheral(address, slot, idx)
+                    if mapping:
+                        offset = address - mapping.base
+                        mapping.peripheral.write(offset, size, value)
+                        return
+                    raise MemoryAccessError(
+                        address, message="No peripheral at this address"
+                    )
+                if kind == _REGION_BITBAND:
+                    if size != 4:
+                        raise MemoryAccessError(
+                            address, message="Bitband accesses must be 4 bytes"
+                        )
+                    self._bitband_write(cast(BitBandRegion, region), address, value)
+                    return
+                region.write(address, size, value)
                 return
-            raise MemoryAccessError(address, message="No peripheral at this address")
 
         raise MemoryAccessError(address, message="Address not mapped")
 
@@ -197,8 +295,8 @@ class AddressSpace(IMemoryMap):
     def reset(self) -> None:
         """Reset all regions and peripherals."""
         self.sram.reset()
-        for mapping in self._peripherals.values():
-            mapping.peripheral.reset()
+        for reset in self._periph_resets:
+            reset()
 
     def get_memory_map(self) -> dict:
         """Return a human-readable description of the memory layout."""
@@ -240,14 +338,47 @@ class AddressSpace(IMemoryMap):
         """Return all regions managed by this address space."""
         return [self.flash, self.sram, self.mmio, *self.bitband_regions]
 
-    def _validate_access(self, address: int, size: int) -> None:
-        """Check access size and alignment."""
-        if size not in (1, 2, 4):
-            raise MemoryAccessError(
-                address, message="Access size must be 1, 2, or 4 bytes"
-            )
-        if size > 1 and address % size != 0:
-            raise MemoryAlignmentError(address, size)
+    def _find_mmio_peripheral(
+        self, address: int, slot: int, span_idx: int
+    ) -> Optional[PeripheralMapping]:
+        """Look up an MMIO peripheral and fill the read/write L1 on success."""
+        mapping = self.find_peripheral(address)
+        if (
+            mapping is not None
+            and self._region_starts[span_idx] <= mapping.base
+            and mapping.end <= self._region_table[span_idx][0]
+        ):
+            self._mmio_l1[slot] = mapping
+        return mapping
+
+    def _build_region_table(self) -> None:
+        """Flatten the regions into sorted (start -> end, kind, region) spans.
+
+        Where regions overlap, the span goes to the region read/write check
+        first: bitband aliases, then flash, SRAM and the MMIO window.
+        """
+        ranked: list[tuple[int, MemoryRegion]] = [
+            *((_REGION_BITBAND, bb) for bb in self.bitband_regions),
+            (_REGION_FLASH, self.flash),
+            (_REGION_SRAM, self.sram),
+            (_REGION_MMIO, self.mmio),
+        ]
+        points = sorted({edge for _, r in ranked for edge in (r.base, r.base + r.size)})
+
+        starts: list[int] = []
+        table: list[tuple[int, int, MemoryRegion]] = []
+        for lo, hi in zip(points, points[1:]):
+            for kind, region in ranked:
+                if region.base <= lo and hi <= region.base + region.size:
+                    if table and table[-1][2] is region and table[-1][0] == lo:
+                        table[-1] = (hi, kind, region)  # extend previous span
+                    else:
+                        starts.append(lo)
+                        table.append((hi, kind, region))
+                    break
+
+        self._region_starts = starts
+        self._region_table = table
 
     def _bitband_read(self, bitband: BitBandRegion, address: int) -> int:
         """Read a bit via bitband alias."""
@@ -269,10 +400,11 @@ class AddressSpace(IMemoryMap):
         return (word >> bit_idx) & 1
 
     def _bitband_write(self, bitband: BitBandRegion, address: int, value: int) -> None:
-        """Write a bit via bitband alias."""
+        """Write a bit via bitband alias (read-modify-write of the target word)."""
         target_addr, bit_idx = bitband.translate(address)
+        bit = _BIT_MASKS[bit_idx]
+        set_bit = value & 1
 
-        # Read-modify-write the underlying word
         if bitband.target_is_peripheral:
             mapping = self.find_peripheral(target_addr)
             if not mapping:
@@ -280,27 +412,12 @@ class AddressSpace(IMemoryMap):
                     target_addr, message="No peripheral under bitband"
                 )
             offset = target_addr - mapping.base
-            word = mapping.peripheral.read(offset, 4)
+            peripheral = mapping.peripheral
+            word = peripheral.read(offset, 4)
+            peripheral.write(offset, 4, (word | bit) if set_bit else (word & ~bit))
         else:
             word = self.sram.read(target_addr, 4)
-
-        # Modify the bit
-        if value & 1:
-            word |= 1 << bit_idx
-        else:
-            word &= ~(1 << bit_idx)
-
-        # Write back
-        if bitband.target_is_peripheral:
-            mapping = self.find_peripheral(target_addr)
-            if not mapping:
-                raise MemoryAccessError(
-                    target_addr, message="No peripheral under bitband"
-                )
-            offset = target_addr - mapping.base
-            mapping.peripheral.write(offset, 4, word)
-        else:
-            self.sram.write(target_addr, 4, word)
+            self.sram.write(target_addr, 4, (word | bit) if set_bit else (word & ~bit))
 
 
 class BaseMemoryMap(AddressSpace):
@@ -14,6 +14,8 @@ class BasePeripheral:
     Concrete peripherals still implement read/write/reset behavior.
     """
 
+    __slots__ = ("name", "size", "base_addr", "_interrupt_controller")
+
     def __init__(self, name: str, size: int, base_addr: int = 0):
         self.name = name
         self.size = size
@@ -52,3 +54,14 @@ class BasePeripheral:
     def write_register(self, offset: int, size: int, value: int) -> None:
         """Alias for write() using register terminology."""
         self.write(offset, size, value)
+
+
+def needs_clock_tick(periph: object) -> bool:
+    """Return True if periph should be subscribed to the clock.
+
+    Peripherals that only inherit BasePeripheral's no-op tick() are left
+    out, so the clock's per-tick loop only visits devices with timed state.
+    """
+    if isinstance(periph, BasePeripheral):
+        return type(periph).tick is not BasePeripheral.tick
+    return hasattr(periph, "tick")
@@ -9,7 +9,28 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
+
+from simulator.utils.consts import ConstUtils
+
+# Access size in bytes -> value mask. Keys double as the set of legal sizes.
+_ACCESS_MASKS: dict[int, int] = {
+    1: ConstUtils.MASK_8_BITS,
+    2: ConstUtils.MASK_16_BITS,
+    4: ConstUtils.MASK_32_BITS,
+}
+
+
+def validate_access_size(size: int) -> int:
+    """Return the value mask for an access size.
+
+    Raises:
+        ValueError: If size is not 1, 2, or 4 bytes
+    """
+    mask = _ACCESS_MASKS.get(size)
+    if mask is None:
+        raise ValueError(f"Invalid access size {size}; must be 1, 2, or 4 bytes")
+    return mask
 
 
 @dataclass(frozen=True)
@@ -42,6 +63,8 @@ class Register(ABC):
     read() / write().
     """
 
+    __slots__ = ("offset", "width", "reset_value", "value")
+
     def __init__(self, offset: int, width: int, reset_value: int = 0):
         """Initialize a register.
 
@@ -65,6 +88,9 @@ class Register(ABC):
         Returns:
             Register value, masked to requested size.
 
+        Raises:
+            ValueError: If access_size is not 1, 2, or 4 bytes
+
         Subclasses should override for registers with side effects on read.
         """
         ...
@@ -77,6 +103,9 @@ class Register(ABC):
             access_size: Bytes being written (1, 2, or 4). Caller ensures alignment.
             val: Value being written (already masked to access_size).
 
+        Raises:
+            ValueError: If access_size is not 1, 2, or 4 bytes
+
         Subclasses should override for registers with side effects on write,
         or if the register is read-only/write-only.
         """
@@ -91,21 +120,52 @@ class Register(ABC):
 class SimpleRegister(Register):
     """A register that is just storage (no side effects)."""
 
+    __slots__ = ()
+
     def read(self, access_size: int) -> int:
-        mask = (1 << (access_size * 8)) - 1
+        mask = _ACCESS_MASKS.get(access_size)
+        if mask is None:
+            mask = validate_access_size(access_size)  # raises ValueError
         return self.value & mask
 
     def write(self, access_size: int, val: int) -> None:
-        mask = (1 << (access_size * 8)) - 1
+        mask = _ACCESS_MASKS.get(access_size)
+        if mask is None:
+            mask = validate_access_size(access_size)  # raises ValueError
         self.value = (self.value & ~mask) | (val & mask)
 
     def reset(self) -> None:
         self.value = self.reset_value
 
 
+class MaskedWriteRegister(SimpleRegister):
+    """Storage register that only accepts writes to bits in write_mask.
+
+    Bits outside write_mask keep their current value, so the owner does not
+    have to AND every incoming value itself.
+    """
+
+    __slots__ = ("write_mask",)
+
+    def __init__(
+        self, offset: int, width: int, reset_value: int = 0, *, write_mask: int
+    ):
+        super().__init__(offset, width, reset_value)
+        self.write_mask = write_mask
+
+    def write(self, access_size: int, val: int) -> None:
+        mask = _ACCESS_MASKS.get(access_size)
+        if mask is None:
+            mask = validate_access_size(access_size)  # raises ValueError
+        mask &= self.write_mask
+        self.value = (self.value & ~mask) | (val & mask)
+
+
 class ReadOnlyRegister(SimpleRegister):
     """A read-only register. Writes are silently ignored."""
 
+    __slots__ = ()
+
     def write(self, access_size: int, val: int) -> None:
         pass  # Ignore writes
 
@@ -113,6 +173,8 @@ class ReadOnlyRegister(SimpleRegister):
 class WriteOnlyRegister(SimpleRegister):
     """A write-only register. Reads always return reset value."""
 
+    __slots__ = ()
+
     def read(self, access_size: int) -> int:
         return self.reset_value
 
@@ -123,10 +185,26 @@ class RegisterFile:
     Maps offset -> Register. Allows mixing simple and complex register types.
 
     Handles alignment and size validation to catch bugs early.
+
+    Dispatch uses a dense list indexed directly by byte offset (register
+    blocks are small and contiguous), so a read/write is one list index
+    instead of a hash lookup. The dict is kept for ownership checks and
+    iteration.
     """
 
-    def __init__(self):
+    def __init__(self, size: int = 0):
+        """Initialize an empty register file.
+
+        Args:
+            size: Optional byte span of the owning peripheral. Pre-sizes the
+                dispatch table so accesses to undefined offsets inside the
+                window also stay on the fast path.
+        """
         self._registers: dict[int, Register] = {}
+        self._table: list[Register | None] = [None] * max(size, 0)
+        # Bound reset() of every register, collected once so reset() is a
+        # flat call loop rather than a dict walk plus per-item method lookup
+        self._resetters: list[Callable[[], None]] = []
 
     def add(self, reg: Register) -> None:
         """Add a register to this file.
@@ -136,8 +214,16 @@ class RegisterFile:
         """
         if reg.offset in self._registers:
             raise ValueError(f"Register at offset 0x{reg.offset:X} already exists")
+        if reg.offset < 0:
+            raise ValueError(f"Register offset must be >= 0, got {reg.offset}")
         self._registers[reg.offset] = reg
 
+        table = self._table
+        if reg.offset >= len(table):
+            table.extend([None] * (reg.offset + 1 - len(table)))
+        table[reg.offset] = reg
+        self._resetters.append(reg.reset)
+
     def read(self, offset: int, access_size: int, default_reset: int = 0) -> int:
         """Read from offset.
 
@@ -148,11 +234,16 @@ class RegisterFile:
 
         If the offset is not in any register, returns default_reset (typically 0).
         """
-        self._validate_size(access_size)
+        mask = self._validate_size(access_size)
 
-        if offset in self._registers:
-            return self._registers[offset].read(access_size)
-        return default_reset & ((1 << (access_size * 8)) - 1)
+        if offset >= 0:
+            try:
+                reg = self._table[offset]
+            except IndexError:
+                reg = None
+            if reg is not None:
+                return reg.read(access_size)
+        return default_reset & mask
 
     def write(self, offset: int, access_size: int, val: int) -> None:
         """Write to offset.
@@ -167,13 +258,18 @@ class RegisterFile:
         """
         self._validate_size(access_size)
 
-        if offset in self._registers:
-            self._registers[offset].write(access_size, val)
+        if offset >= 0:
+            try:
+                reg = self._table[offset]
+            except IndexError:
+                return
+            if reg is not None:
+                reg.write(access_size, val)
 
     def reset(self) -> None:
         """Reset all registers."""
-        for reg in self._registers.values():
-            reg.reset()
+        for reset in self._resetters:
+            reset()
 
     def get_register(self, offset: int) -> Optional[Register]:
         """Return the register at offset, or None."""
@@ -182,7 +278,6 @@ class RegisterFile:
     # Private helpers -------------------------------------------------------
 
     @staticmethod
-    def _validate_size(size: int) -> None:
-        """Check that size is valid."""
-        if size not in (1, 2, 4):
-            raise ValueError(f"Invalid access size {size}; must be 1, 2, or 4 bytes")
+    def _validate_size(size: int) -> int:
+        """Check that size is valid and return its value mask."""
+        return validate_access_size(size)
@@ -8,12 +8,14 @@ reads/writes like real hardware register files.
 
 from __future__ import annotations
 
+from typing import Mapping
+
 from simulator.core.peripheral import BasePeripheral
 from simulator.core.register import RegisterFile, SimpleRegister
 from simulator.utils.config_loader import SysCtlConfig
 
 
-def _infer_size(registers: dict[str, int]) -> int:
+def _infer_size(registers: Mapping[str, int]) -> int:
     """Infer a safe peripheral size from register offsets.
 
     Align to 0x100 to avoid tiny ranges and to cover typical sysctl blocks.
@@ -32,7 +34,7 @@ class SysCtl(BasePeripheral):
         size = _infer_size(cfg.registers)
         super().__init__(name=name or "SYSCTL", size=size, base_addr=base_addr)
         self.cfg = cfg
-        self._registers = RegisterFile()
+        self._registers = RegisterFile(size)
 
         for _name, offset in cfg.registers.items():
             self._registers.add(SimpleRegister(offset, 4, 0))
@@ -5,19 +5,45 @@ Defines behavioral contracts that all implementations must satisfy:
 - Peripheral: Memory-mapped peripheral protocol
 - MemoryAccessModel: How addresses map to hardware registers (board-specific semantics)
 - PinLevel, PinMode: GPIO enumerations (re-exported from core for convenience)
+
+Exports are resolved lazily (PEP 562) so importing a single interface module
+does not pull in the board/memory-map stack.
 """
 
-from simulator.core.gpio_enums import PinLevel, PinMode
-from simulator.interfaces.board import Board
-from simulator.interfaces.clock import ClockSubscriber, IClock
-from simulator.interfaces.cpu import ICPU, CpuSnapshot, RegisterValue
-from simulator.interfaces.interrupt_controller import (
-    IInterruptController,
-    InterruptEvent,
-)
-from simulator.interfaces.memory_access import MemoryAccessModel
-from simulator.interfaces.memory_map import IMemoryMap
-from simulator.interfaces.peripheral import Peripheral
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from simulator.core.gpio_enums import PinLevel, PinMode
+    from simulator.interfaces.board import Board
+    from simulator.interfaces.clock import ClockSubscriber, IClock
+    from simulator.interfaces.cpu import ICPU, CpuSnapshot, RegisterValue
+    from simulator.interfaces.interrupt_controller import (
+        IInterruptController,
+        InterruptEvent,
+    )
+    from simulator.interfaces.memory_access import MemoryAccessModel
+    from simulator.interfaces.memory_map import IMemoryMap
+    from simulator.interfaces.peripheral import Peripheral
+
+# Public name -> defining module
+_LAZY_EXPORTS: dict[str, str] = {
+    "Board": "simulator.interfaces.board",
+    "ICPU": "simulator.interfaces.cpu",
+    "CpuSnapshot": "simulator.interfaces.cpu",
+    "RegisterValue": "simulator.interfaces.cpu",
+    "IClock": "simulator.interfaces.clock",
+    "ClockSubscriber": "simulator.interfaces.clock",
+    "IInterruptController": "simulator.interfaces.interrupt_controller",
+    "InterruptEvent": "simulator.interfaces.interrupt_controller",
+    "IMemoryMap": "simulator.interfaces.memory_map",
+    "Peripheral": "simulator.interfaces.peripheral",
+    "MemoryAccessModel": "simulator.interfaces.memory_access",
+    "PinLevel": "simulator.core.gpio_enums",
+    "PinMode": "simulator.core.gpio_enums",
+}
 
 __all__ = [
     "Board",
@@ -34,3 +60,16 @@ __all__ = [
     "PinLevel",
     "PinMode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
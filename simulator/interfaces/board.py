@@ -30,6 +30,8 @@ class Board(ABC):
     must inherit from this class and implement all abstract properties.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
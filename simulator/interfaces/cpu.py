@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 class ICPU(ABC):
     """CPU abstraction used by boards and the simulation engine."""
 
+    __slots__ = ()
+
     @abstractmethod
     def step(self) -> None:
         """Execute a single instruction."""
@@ -38,7 +40,7 @@ class ICPU(ABC):
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterValue:
     """Single register value for UI/debug panels."""
 
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 
-@dataclass(frozen=True)
-class InterruptEvent:
-    """Represents a pending interrupt event."""
+class InterruptEvent(NamedTuple):
+    """Represents a pending interrupt event.
+
+    A NamedTuple: construction, equality and hashing are C-level tuple
+    operations, which matters since one is built per notify(). Like any
+    tuple, an event compares equal to a plain (source, vector, timestamp)
+    tuple, and ordering compares fields in turn, so it raises TypeError
+    when the sources themselves are not orderable.
+    """
 
     source: object
     vector: int | None = None
@@ -27,6 +27,8 @@ class MemoryAccessModel(ABC):
     different boards have different access semantics.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def decode_register_access(self, address: int, size: int) -> tuple[str, int] | None:
         """Decode an address to determine what register is being accessed.
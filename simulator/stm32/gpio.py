@@ -29,7 +29,7 @@ the address itself encodes which bits are accessible. See tm4c/gpio.py.
 
 from __future__ import annotations
 
-from simulator.core.gpio_enums import PinLevel
+from simulator.core.gpio_enums import HIGH_INT, PIN_LEVELS, PinLevel
 from simulator.core.peripheral import BasePeripheral
 from simulator.core.register import (
     ReadOnlyRegister,
@@ -37,13 +37,26 @@ from simulator.core.register import (
     RegisterFile,
     SimpleRegister,
     WriteOnlyRegister,
+    validate_access_size,
 )
 from simulator.utils.config_loader import Stm32GpioConfig
+from simulator.utils.consts import ConstUtils
+
+
+def _width_masks(data_mask: int) -> dict[int, int]:
+    """Map access size (1, 2, 4) to the data mask narrowed to that width."""
+    return {
+        1: data_mask & ConstUtils.MASK_8_BITS,
+        2: data_mask & ConstUtils.MASK_16_BITS,
+        4: data_mask & ConstUtils.MASK_32_BITS,
+    }
 
 
 class STM32OutputDataRegister(SimpleRegister):
     """ODR register: software-controlled output state."""
 
+    __slots__ = ()
+
 
 class STM32InputDataRegister(ReadOnlyRegister):
     """IDR register: read-only input state.
@@ -52,18 +65,26 @@ class STM32InputDataRegister(ReadOnlyRegister):
     In simulation, we allow setting external input via set_pin(), or default to ODR.
     """
 
+    __slots__ = ("odr", "_data_mask", "_external_inputs", "_read_masks")
+
     def __init__(self, offset: int, odr_register: Register, data_mask: int):
         super().__init__(offset, 4, 0)
         self.odr = odr_register
         self._data_mask = data_mask
         self._external_inputs: int | None = None  # None means "follow ODR"
+        # Data mask narrowed to each access width, so read() is one AND
+        self._read_masks = _width_masks(data_mask)
 
     def read(self, access_size: int) -> int:
         # If external inputs are set (simulating external pin state), return those
         # Otherwise, reflect the output state
-        if self._external_inputs is not None:
-            return self._external_inputs & self._data_mask
-        return self.odr.read(access_size)
+        value = self._external_inputs
+        if value is None:
+            value = self.odr.value
+        mask = self._read_masks.get(access_size)
+        if mask is None:
+            mask = validate_access_size(access_size)  # raises ValueError
+        return value & mask
 
     def set_external_input(self, value: int) -> None:
         """Set external input state (simulates pins being driven externally)."""
@@ -73,6 +94,17 @@ class STM32InputDataRegister(ReadOnlyRegister):
         """Return external input state (or None if following ODR)."""
         return self._external_inputs
 
+    def drive_bits(self, set_mask: int, clear_mask: int) -> None:
+        """Drive input bits high (set_mask) and low (clear_mask) in one RMW.
+
+        Starts from the current ODR value if no external input is set yet.
+        Bits present in both masks end up cleared.
+        """
+        current = self._external_inputs
+        if current is None:
+            current = self.odr.value
+        self._external_inputs = (current | set_mask) & ~clear_mask & self._data_mask
+
 
 class STM32BitSetResetRegister(WriteOnlyRegister):
     """BSRR: atomic set/reset register.
@@ -81,6 +113,8 @@ class STM32BitSetResetRegister(WriteOnlyRegister):
     Writing to BSRR atomically modifies ODR.
     """
 
+    __slots__ = ("odr", "_data_mask")
+
     def __init__(self, offset: int, odr_register: Register, data_mask: int):
         super().__init__(offset, 4, 0)
         self.odr = odr_register
@@ -88,15 +122,13 @@ class STM32BitSetResetRegister(WriteOnlyRegister):
 
     def write(self, access_size: int, val: int) -> None:
         if access_size != 4:
+            validate_access_size(access_size)  # unsupported sizes fail as usual
             raise ValueError("BSRR must be accessed as 32-bit word")
 
-        set_mask = val & self._data_mask
-        reset_mask = (val >> 16) & self._data_mask
-
-        current = self.odr.read(4)
-        current |= set_mask
-        current &= ~reset_mask
-        self.odr.write(4, current & self._data_mask)
+        # Single RMW on ODR storage; the data mask bounds both halves
+        mask = self._data_mask
+        odr = self.odr
+        odr.value = (odr.value | val) & ~(val >> 16) & mask
 
 
 class STM32GPIO(BasePeripheral):
@@ -112,6 +144,22 @@ class STM32GPIO(BasePeripheral):
     - BSRR @ 0x18 (bit set/reset, write-only atomic updates)
     """
 
+    __slots__ = (
+        "cfg",
+        "_data_mask",
+        "_pin_count",
+        "_valid_pins",
+        "_pin_bits",
+        "_registers",
+        "_odr",
+        "_idr",
+        "_bsrr",
+        "_odr_off",
+        "_idr_off",
+        "_bsrr_off",
+        "_width_masks",
+    )
+
     def __init__(
         self,
         cfg: Stm32GpioConfig,
@@ -128,7 +176,11 @@ class STM32GPIO(BasePeripheral):
             raise ValueError("data_mask must be positive")
         self._data_mask = data_mask
         self._pin_count = data_mask.bit_length()
-        self._registers = RegisterFile()
+        # range containment is a single C-level bounds check per pin access
+        self._valid_pins = range(self._pin_count)
+        # Per-pin single-bit masks, computed once instead of 1 << pin per call
+        self._pin_bits = tuple(1 << pin for pin in self._valid_pins)
+        self._registers = RegisterFile(cfg.port_size)
 
         # Create the actual register objects using config offsets
         odr = STM32OutputDataRegister(
@@ -143,16 +195,40 @@ class STM32GPIO(BasePeripheral):
 
         self._odr = odr
         self._idr = idr
+        self._bsrr = bsrr
+
+        # Hot-path offsets as plain ints so read/write go straight to the
+        # register instead of through RegisterFile dispatch
+        self._odr_off = cfg.offsets.odr
+        self._idr_off = cfg.offsets.idr
+        self._bsrr_off = cfg.offsets.bsrr
+        # ODR value is kept within the data mask, so narrowing it to the
+        # access width gives the bits an ODR access can see or change
+        self._width_masks = _width_masks(self._data_mask)
 
     def read(self, offset: int, size: int) -> int:
         """Read from a GPIO register."""
+        if offset == self._idr_off:
+            return self._idr.read(size)
+        if offset == self._odr_off:
+            mask = self._width_masks.get(size)
+            if mask is None:
+                mask = validate_access_size(size)  # raises ValueError
+            return self._odr.value & mask
         return self._registers.read(offset, size, default_reset=0)
 
     def write(self, offset: int, size: int, value: int) -> None:
         """Write to a GPIO register."""
         # BSRR needs the full 32-bit value (bits 31:16 for reset, 15:0 for set)
-        if offset == self.cfg.offsets.bsrr:
-            self._registers.write(offset, size, value)
+        if offset == self._bsrr_off:
+            self._bsrr.write(size, value)
+        elif offset == self._odr_off:
+            # Same merge as SimpleRegister.write, inlined on the ODR storage
+            odr = self._odr
+            mask = self._width_masks.get(size)
+            if mask is None:
+                mask = validate_access_size(size)  # raises ValueError
+            odr.value = (odr.value & ~mask) | (value & mask)
         else:
             # Other registers use only lower 16 bits for 16-bit port
             self._registers.write(offset, size, value & self._data_mask)
@@ -164,28 +240,32 @@ class STM32GPIO(BasePeripheral):
     # Convenience methods for testing/debugging
     def set_pin(self, pin: int, level: PinLevel) -> None:
         """Set a single pin via IDR (simulating external input)."""
-        if not 0 <= pin < self._pin_count:
+        if pin not in self._valid_pins:
             raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
-        # Get current external input state (or start from ODR if none set)
-        current = self._idr.get_external_input()
-        if current is None:
-            current = self._odr.read(4)
+        bit = self._pin_bits[pin]
+        set_mask = bit * (level == HIGH_INT)  # bit when high, 0 when low
+        self._idr.drive_bits(set_mask, bit ^ set_mask)
 
-        if level == PinLevel.HIGH:
-            current |= 1 << pin
-        else:
-            current &= ~(1 << pin)
-        self._idr.set_external_input(current)
+    def set_pins_mask(self, set_mask: int, clear_mask: int) -> None:
+        """Drive several input pins at once (batch form of set_pin).
+
+        Pins in set_mask go high, pins in clear_mask go low (clear wins when
+        a pin is in both). Bits outside the port's data mask are ignored.
+        """
+        self._idr.drive_bits(set_mask, clear_mask)
 
     def get_pin(self, pin: int) -> PinLevel:
         """Get the state of a pin (output)."""
-        if not 0 <= pin < self._pin_count:
+        if pin not in self._valid_pins:
             raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
-        odr_val = self._odr.read(4)
-        return PinLevel((odr_val >> pin) & 1)
+        return PIN_LEVELS[(self._odr.value >> pin) & 1]
+
+    def read_pins_mask(self, mask: int) -> int:
+        """Return the output state of the pins selected by mask."""
+        return self._odr.value & mask
 
     def get_port_state(self) -> int:
         """Get the entire port state (ODR value)."""
-        return self._odr.read(4)
+        return self._odr.value
@@ -18,20 +18,14 @@ Register offsets (relative to GPIO port base):
 
 from __future__ import annotations
 
-from simulator.interfaces.memory_access import MemoryAccessModel
-
-
-class STM32F4DirectAccessModel(MemoryAccessModel):
-    """Direct register offset mapping for STM32F4 GPIO.
-
-    In this model, address directly selects a register:
-        register = (address - gpio_base) & 0xFF
+from types import MappingProxyType
+from typing import Final, Mapping
 
-    This is the simplest and most common pattern for ARM Cortex-M MCUs.
-    """
+from simulator.interfaces.memory_access import MemoryAccessModel
 
-    # Register offset mappings (from STM32F4 datasheet)
-    _REGISTERS = {
+# Register offset mappings (from STM32F4 datasheet)
+_REGISTERS: Final[Mapping[int, str]] = MappingProxyType(
+    {
         0x00: "MODER",
         0x04: "OTYPER",
         0x08: "OSPEEDR",
@@ -43,8 +37,28 @@ class STM32F4DirectAccessModel(MemoryAccessModel):
         0x20: "AFRL",
         0x24: "AFRH",
     }
+)
 
-    _ADDRESSES = {v: k for k, v in _REGISTERS.items()}
+_ADDRESSES: Final[Mapping[str, int]] = MappingProxyType(
+    {v: k for k, v in _REGISTERS.items()}
+)
+
+# Direct-indexed decode table covering the 0x100-byte register window
+_REG_TABLE: Final[tuple[str | None, ...]] = tuple(
+    _REGISTERS.get(offset) for offset in range(0x100)
+)
+
+
+class STM32F4DirectAccessModel(MemoryAccessModel):
+    """Direct register offset mapping for STM32F4 GPIO.
+
+    In this model, address directly selects a register:
+        register = (address - gpio_base) & 0xFF
+
+    This is the simplest and most common pattern for ARM Cortex-M MCUs.
+    """
+
+    __slots__ = ("gpio_base",)
 
     def __init__(self, gpio_base: int):
         """Initialize with GPIO port base address.
@@ -64,23 +78,21 @@ class STM32F4DirectAccessModel(MemoryAccessModel):
         Returns:
             (register_name, offset_within_register) if valid, None otherwise
         """
-        if address < self.gpio_base or address >= self.gpio_base + 0x100:
-            return None
-
         offset = address - self.gpio_base
-        reg_offset = offset & 0xFF  # Keep only register offset
-
-        if reg_offset not in self._REGISTERS:
+        if not 0 <= offset < 0x100:
             return None
 
-        register_name = self._REGISTERS[reg_offset]
+        register_name = _REG_TABLE[offset]
+        if register_name is None:
+            return None
         return (register_name, offset)
 
     def encode_register_address(self, register_name: str) -> int:
         """Convert register name to absolute address."""
-        if register_name not in self._ADDRESSES:
+        reg_offset = _ADDRESSES.get(register_name)
+        if reg_offset is None:
             raise ValueError(f"Unknown register: {register_name}")
-        return self.gpio_base + self._ADDRESSES[register_name]
+        return self.gpio_base + reg_offset
 
     @property
     def description(self) -> str:
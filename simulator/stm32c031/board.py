@@ -12,6 +12,8 @@ from typing import Any
 from simulator.core.builders import (
     create_address_space_from_config,
     create_cpu_for_address_space,
+    gpio_data_mask,
+    wire_clock_and_interrupts,
 )
 from simulator.core.clock import Clock
 from simulator.core.cpu import CortexM
@@ -23,16 +25,27 @@ from simulator.interfaces.memory_access import MemoryAccessModel
 from simulator.interfaces.peripheral import Peripheral
 from simulator.stm32.gpio import STM32GPIO
 from simulator.stm32.memory_access import STM32F4DirectAccessModel
-from simulator.utils.config_loader import load_config
+from simulator.utils.config_loader import get_config
 
 
 class STM32C031Board(Board):
     """STM32C031 micro board with ARM Cortex-M0+."""
 
+    __slots__ = (
+        "config",
+        "_address_space",
+        "_cpu",
+        "_memory_access_model",
+        "_clock",
+        "_interrupt_ctrl",
+        "_peripherals",
+    )
+
     def __init__(self, **_kwargs: Any):
         # Load board configuration from variant's local config file
         config_path = Path(__file__).parent / "config.yaml"
-        config = load_config("stm32c031", path=str(config_path))
+        # Parsed once per process; the frozen config is shared across boards
+        config = get_config("stm32c031", path=str(config_path))
         self.config = config
 
         # Use factory to create address space
@@ -42,9 +55,7 @@ class STM32C031Board(Board):
         self._cpu = create_cpu_for_address_space(self._address_space)
 
         # Memory access model for this board's peripherals
-        gpio_base = (
-            list(config.gpio.ports.values())[0] if config.gpio.ports else 0x50000000
-        )
+        gpio_base = next(iter(config.gpio.ports.values()), 0x50000000)
         self._memory_access_model = STM32F4DirectAccessModel(gpio_base)
 
         # Core timing + interrupt infrastructure
@@ -59,13 +70,8 @@ class STM32C031Board(Board):
         self._wire_clock_and_interrupts()
 
     def _pin_data_mask(self) -> int:
-        """Compute GPIO data mask from config pin masks."""
-        mask = 0
-        for value in self.config.pins.pin_masks.values():
-            mask |= value
-        if mask == 0:
-            raise ValueError("GPIO pin mask is empty; check config.pins.pin_masks")
-        return mask
+        """Return the GPIO data mask derived from config pin masks."""
+        return gpio_data_mask(self.config.pins)
 
     def _init_sysctl(self) -> None:
         """Initialize system control (RCC/SYSCTL) registers."""
@@ -85,6 +91,7 @@ class STM32C031Board(Board):
             raise ValueError(f"Expected stm32 GPIO config, got {gpio_config.kind}")
         data_mask = self._pin_data_mask()
 
+        entries = []
         for port_name, base_address in gpio_config.ports.items():
             gpio = STM32GPIO(
                 gpio_config,
@@ -94,25 +101,20 @@ class STM32C031Board(Board):
                 name=f"GPIO_{port_name}",
             )
 
-            # Register in peripheral dict and address space
             self._peripherals[f"GPIO_{port_name}"] = gpio
-            self._address_space.register_peripheral(
-                base_address,
-                gpio_config.port_size,
-                gpio,
-            )
+            entries.append((base_address, gpio_config.port_size, gpio))
+
+        # Map every port in one batch: validated together, index built once
+        self._address_space.register_peripherals(entries)
 
     def _wire_clock_and_interrupts(self) -> None:
         """Wire CPU/peripherals to the clock and interrupt controller."""
-        self._clock.subscribe(self._cpu)
-        for periph in self._peripherals.values():
-            # Clock subscription (if supported)
-            if hasattr(periph, "tick"):
-                self._clock.subscribe(periph)
-            # Interrupt registration
-            if hasattr(periph, "attach_interrupt_controller"):
-                periph.attach_interrupt_controller(self._interrupt_ctrl)
-            self._interrupt_ctrl.subscribe(periph)
+        wire_clock_and_interrupts(
+            self._clock,
+            self._interrupt_ctrl,
+            self._cpu,
+            self._peripherals.values(),
+        )
 
     @property
     def name(self) -> str:
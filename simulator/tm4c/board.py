@@ -10,6 +10,8 @@ from typing import Any
 from simulator.core.builders import (
     create_address_space_from_config,
     create_cpu_for_address_space,
+    gpio_data_mask,
+    wire_clock_and_interrupts,
 )
 from simulator.core.clock import Clock
 from simulator.core.cpu import CortexM
@@ -19,7 +21,7 @@ from simulator.core.sysctl import SysCtl
 from simulator.interfaces.board import Board
 from simulator.interfaces.memory_access import MemoryAccessModel
 from simulator.interfaces.peripheral import Peripheral
-from simulator.utils.config_loader import load_config
+from simulator.utils.config_loader import get_config
 
 from .gpio import TM4C123GPIO
 from .memory_access import TM4C123BitBandedAccessModel
@@ -28,10 +30,20 @@ from .memory_access import TM4C123BitBandedAccessModel
 class TM4C123Board(Board):
     """TM4C123GH6PM development board."""
 
+    __slots__ = (
+        "config",
+        "_address_space",
+        "_cpu",
+        "_memory_access_model",
+        "_clock",
+        "_interrupt_ctrl",
+        "_peripherals",
+    )
+
     def __init__(self, **_kwargs: Any):
         # Load board configuration from variant's local config file
         config_path = Path(__file__).parent / "config.yaml"
-        config = load_config("tm4c123", path=str(config_path))
+        config = get_config("tm4c123", path=str(config_path))
         self.config = config
 
         # Use factory to create address space
@@ -42,9 +54,7 @@ class TM4C123Board(Board):
 
         # Memory access model for this board's peripherals
         # TM4C123 uses bit-banded addressing (address encodes bit mask)
-        gpio_base = (
-            list(config.gpio.ports.values())[0] if config.gpio.ports else 0x40004000
-        )
+        gpio_base = next(iter(config.gpio.ports.values()), 0x40004000)
         self._memory_access_model = TM4C123BitBandedAccessModel(gpio_base, num_pins=8)
 
         # Core timing + interrupt infrastructure
@@ -59,13 +69,8 @@ class TM4C123Board(Board):
         self._wire_clock_and_interrupts()
 
     def _pin_data_mask(self) -> int:
-        """Compute GPIO data mask from config pin masks."""
-        mask = 0
-        for value in self.config.pins.pin_masks.values():
-            mask |= value
-        if mask == 0:
-            raise ValueError("GPIO pin mask is empty; check config.pins.pin_masks")
-        return mask
+        """Return the GPIO data mask derived from config pin masks."""
+        return gpio_data_mask(self.config.pins)
 
     def _init_sysctl(self) -> None:
         """Initialize system control (SYSCTL) registers."""
@@ -85,6 +90,7 @@ class TM4C123Board(Board):
             raise ValueError(f"Expected tm4c123 GPIO config, got {gpio_config.kind}")
         data_mask = self._pin_data_mask()
 
+        entries = []
         for port_name, base_address in gpio_config.ports.items():
             gpio = TM4C123GPIO(
                 gpio_config,
@@ -94,23 +100,20 @@ class TM4C123Board(Board):
                 name=f"GPIO_{port_name}",
             )
 
-            # Register in peripheral dict and address space
             self._peripherals[f"GPIO_{port_name}"] = gpio
-            self._address_space.register_peripheral(
-                base_address,
-                gpio_config.port_size,
-                gpio,
-            )
+            entries.append((base_address, gpio_config.port_size, gpio))
+
+        # Map every port in one batch: validated together, index built once
+        self._address_space.register_peripherals(entries)
 
     def _wire_clock_and_interrupts(self) -> None:
         """Wire CPU/peripherals to the clock and interrupt controller."""
-        self._clock.subscribe(self._cpu)
-        for periph in self._peripherals.values():
-            if hasattr(periph, "tick"):
-                self._clock.subscribe(periph)
-            if hasattr(periph, "attach_interrupt_controller"):
-                periph.attach_interrupt_controller(self._interrupt_ctrl)
-            self._interrupt_ctrl.subscribe(periph)
+        wire_clock_and_interrupts(
+            self._clock,
+            self._interrupt_ctrl,
+            self._cpu,
+            self._peripherals.values(),
+        )
 
     @property
     def name(self) -> str:
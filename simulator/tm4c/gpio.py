@@ -52,18 +52,55 @@ but requires software bit manipulation for atomic operations.
 
 from __future__ import annotations
 
-from simulator.core.gpio_enums import PinLevel, PinMode
+import functools
+from typing import Callable
+
+from simulator.core.gpio_enums import (
+    ALTERNATE_INT,
+    HIGH_INT,
+    OUTPUT_INT,
+    PIN_LEVELS,
+    PinLevel,
+    PinMode,
+)
 from simulator.core.peripheral import BasePeripheral
 from simulator.core.register import (
+    MaskedWriteRegister,
     ReadOnlyRegister,
     RegisterFile,
-    SimpleRegister,
     WriteOnlyRegister,
+    validate_access_size,
 )
 from simulator.utils.config_loader import Tm4cGpioConfig
 
+# PinMode -> (DIR bit set, AFSEL bit set). Modes not listed are inputs.
+_PIN_MODE_BITS: dict[int, tuple[bool, bool]] = {
+    OUTPUT_INT: (True, False),
+    ALTERNATE_INT: (False, True),
+}
+_INPUT_MODE_BITS = (False, False)
+
+# Last byte offset of the masked DATA window (DATA + 0x000 .. DATA + 0x3FC)
+_MASKED_DATA_SPAN = 0x3FC
+
+
+@functools.lru_cache(maxsize=None)
+def _masked_data_tables(
+    data_mask: int,
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """Build per-offset (read, write, keep) masks for the masked DATA window.
 
-class TM4CMaskedDataRegister(SimpleRegister):
+    Indexed by offset from DATA. Offset 0 reads the whole port; elsewhere
+    address bits [9:2] select the pins. keep is the complement of the write
+    mask within the data mask. Shared by every port with the same data mask.
+    """
+    pin_masks = tuple((diff >> 2) & data_mask for diff in range(_MASKED_DATA_SPAN + 1))
+    read_masks = (data_mask,) + pin_masks[1:]
+    keep_masks = tuple(~mask & data_mask for mask in pin_masks)
+    return read_masks, pin_masks, keep_masks
+
+
+class TM4CMaskedDataRegister(MaskedWriteRegister):
     """Special TM4C feature: masked data access.
 
     Writing to DATA+4, DATA+8, ..., DATA+0x3FC applies only to selected pins.
@@ -72,43 +109,53 @@ class TM4CMaskedDataRegister(SimpleRegister):
     Example: write to (DATA + 0x0C) -> mask = 0x0C >> 2 = 3 -> affects pins 0,1
     """
 
+    __slots__ = (
+        "data_offset",
+        "_data_mask",
+        "_read_masks",
+        "_write_masks",
+        "_keep_masks",
+    )
+
     def __init__(self, offset: int, data_mask: int):
-        super().__init__(offset, 4, 0)
+        super().__init__(offset, 4, 0, write_mask=data_mask)
         self.data_offset = offset
         self._data_mask = data_mask
+        self._read_masks, self._write_masks, self._keep_masks = _masked_data_tables(
+            data_mask
+        )
 
     def write_masked(self, address: int, value: int) -> None:
         """Write with mask applied from address bits."""
         # Address bits [11:2] become the mask
         diff = address - self.data_offset
-        if diff <= 0 or diff > 0x3FC:
+        if diff <= 0 or diff > _MASKED_DATA_SPAN:
             raise ValueError(f"Invalid masked write offset {diff:X}")
 
-        mask = (diff >> 2) & self._data_mask
-        current = self.value & self._data_mask
-        new_value = (current & ~mask) | (value & mask)
-        self.value = new_value
+        self.value = (self.value & self._keep_masks[diff]) | (
+            value & self._write_masks[diff]
+        )
 
     def read_masked(self, address: int) -> int:
         """Read with mask applied."""
         diff = address - self.data_offset
-        if diff < 0 or diff > 0x3FC:
+        if diff < 0 or diff > _MASKED_DATA_SPAN:
             return 0
 
-        if diff == 0:
-            return self.value & self._data_mask
-
-        mask = (diff >> 2) & self._data_mask
-        return self.value & mask
+        return self.value & self._read_masks[diff]
 
 
 class TM4CRawInterruptStatus(ReadOnlyRegister):
     """RIS: raw interrupt flags before masking."""
 
+    __slots__ = ()
+
 
 class TM4CInterruptClear(WriteOnlyRegister):
     """ICR: write 1 to clear interrupt flags."""
 
+    __slots__ = ("ris",)
+
     def __init__(self, offset: int, ris_register: TM4CRawInterruptStatus):
         super().__init__(offset, 4, 0)
         self.ris = ris_register
@@ -131,6 +178,28 @@ class TM4C123GPIO(BasePeripheral):
     - Pin modes (input, output, alternate)
     """
 
+    __slots__ = (
+        "cfg",
+        "_data_off",
+        "_mis_off",
+        "_data_mask",
+        "_pin_count",
+        "_valid_pins",
+        "_pin_bits",
+        "_pin_clear",
+        "_registers",
+        "_readers",
+        "_writers",
+        "_data_reg",
+        "_ris_reg",
+        "_icr_reg",
+        "_dir_reg",
+        "_den_reg",
+        "_afsel_reg",
+        "_is_reg",
+        "_im_reg",
+    )
+
     def __init__(
         self,
         cfg: Tm4cGpioConfig,
@@ -143,11 +212,20 @@ class TM4C123GPIO(BasePeripheral):
             name=name or "TM4C123GPIO", size=cfg.port_size, base_addr=base_addr
         )
         self.cfg = cfg
+        # Offsets checked on every read/write, bound once as plain ints
+        self._data_off = cfg.offsets.data
+        self._mis_off = cfg.offsets.mis
         if data_mask <= 0:
             raise ValueError("data_mask must be positive")
         self._data_mask = data_mask
         self._pin_count = data_mask.bit_length()
-        self._registers = RegisterFile()
+        # range containment is a single C-level bounds check per pin access
+        self._valid_pins = range(self._pin_count)
+        # Per-pin single-bit masks, computed once instead of 1 << pin per call
+        self._pin_bits = tuple(1 << pin for pin in self._valid_pins)
+        # Inverse single-bit masks, so clearing a pin touches only that bit
+        self._pin_clear = tuple(~bit for bit in self._pin_bits)
+        self._registers = RegisterFile(cfg.port_size)
 
         # Initialize registers
         data_reg = TM4CMaskedDataRegister(cfg.offsets.data, self._data_mask)
@@ -156,24 +234,38 @@ class TM4C123GPIO(BasePeripheral):
         ris_reg = TM4CRawInterruptStatus(cfg.offsets.ris, 4, 0)
         icr_reg = TM4CInterruptClear(cfg.offsets.icr, ris_reg)
 
-        dir_reg = SimpleRegister(cfg.offsets.dir, 4, 0)
-        den_reg = SimpleRegister(cfg.offsets.den, 4, 0)
-        afsel_reg = SimpleRegister(cfg.offsets.afsel, 4, 0)
-        is_reg = SimpleRegister(cfg.offsets.is_, 4, 0)
-        ibe_reg = SimpleRegister(cfg.offsets.ibe, 4, 0)
-        iev_reg = SimpleRegister(cfg.offsets.iev, 4, 0)
-        im_reg = SimpleRegister(cfg.offsets.im, 4, 0)
-
+        dir_reg = MaskedWriteRegister(cfg.offsets.dir, 4, 0, write_mask=data_mask)
+        den_reg = MaskedWriteRegister(cfg.offsets.den, 4, 0, write_mask=data_mask)
+        afsel_reg = MaskedWriteRegister(cfg.offsets.afsel, 4, 0, write_mask=data_mask)
+        is_reg = MaskedWriteRegister(cfg.offsets.is_, 4, 0, write_mask=data_mask)
+        ibe_reg = MaskedWriteRegister(cfg.offsets.ibe, 4, 0, write_mask=data_mask)
+        iev_reg = MaskedWriteRegister(cfg.offsets.iev, 4, 0, write_mask=data_mask)
+        im_reg = MaskedWriteRegister(cfg.offsets.im, 4, 0, write_mask=data_mask)
+
+        control_regs = (
+            ris_reg,
+            icr_reg,
+            dir_reg,
+            den_reg,
+            afsel_reg,
+            is_reg,
+            ibe_reg,
+            iev_reg,
+            im_reg,
+        )
         self._registers.add(data_reg)
-        self._registers.add(ris_reg)
-        self._registers.add(icr_reg)
-        self._registers.add(dir_reg)
-        self._registers.add(den_reg)
-        self._registers.add(afsel_reg)
-        self._registers.add(is_reg)
-        self._registers.add(ibe_reg)
-        self._registers.add(iev_reg)
-        self._registers.add(im_reg)
+        for reg in control_regs:
+            self._registers.add(reg)
+
+        # Offset -> handler for everything outside the masked DATA window.
+        # Each register applies its own write mask: ICR takes the full word
+        # so any flag can be cleared, the rest only store the port's pins.
+        self._readers: dict[int, Callable[[int], int]] = {
+            reg.offset: reg.read for reg in control_regs
+        }
+        self._writers: dict[int, Callable[[int, int], None]] = {
+            reg.offset: reg.write for reg in (data_reg, *control_regs)
+        }
 
         self._data_reg = data_reg
         self._ris_reg = ris_reg
@@ -187,44 +279,42 @@ class TM4C123GPIO(BasePeripheral):
     def read(self, offset: int, size: int) -> int:
         """Read from a GPIO register."""
         # Handle masked DATA reads
-        data_base = self.cfg.offsets.data
-        diff = offset - data_base
+        diff = offset - self._data_off
 
-        if 0 <= diff <= 0x3FC:
+        if 0 <= diff <= _MASKED_DATA_SPAN:
             return self._data_reg.read_masked(offset)
 
+        # Same size check as RegisterFile, so every control offset fails alike
+        validate_access_size(size)
+        reader = self._readers.get(offset)
+        if reader is not None:
+            return reader(size)
+
         # Masked interrupt status (MIS = RIS & IM)
-        if offset == self.cfg.offsets.mis:
-            ris = self._registers.read(self.cfg.offsets.ris, 4, 0)
-            im = self._registers.read(self.cfg.offsets.im, 4, 0)
-            return ris & im
+        if offset == self._mis_off:
+            return self._ris_reg.value & self._im_reg.value
 
+        # Undefined offset: RegisterFile returns 0
         return self._registers.read(offset, size, default_reset=0)
 
     def write(self, offset: int, size: int, value: int) -> None:
         """Write to a GPIO register."""
         # Handle masked DATA writes
-        data_base = self.cfg.offsets.data
-        diff = offset - data_base
+        diff = offset - self._data_off
 
-        if 0 < diff <= 0x3FC:
+        if 0 < diff <= _MASKED_DATA_SPAN:
             if size != 4:
                 raise ValueError("Masked DATA accesses must be 32-bit")
             self._data_reg.write_masked(offset, value)
             return
 
-        if diff == 0:
-            # Direct DATA write
-            self._registers.write(offset, size, value & self._data_mask)
-            return
-
-        # Interrupt clear
-        if offset == self.cfg.offsets.icr:
-            self._registers.write(offset, size, value)
+        validate_access_size(size)
+        writer = self._writers.get(offset)
+        if writer is not None:
+            writer(size, value)
             return
-
-        # All other registers
-        self._registers.write(offset, size, value & self._data_mask)
+        # Undefined offset: RegisterFile drops the write
+        self._registers.write(offset, size, value)
 
     def reset(self) -> None:
         """Reset all registers."""
@@ -233,57 +323,68 @@ class TM4C123GPIO(BasePeripheral):
     # Convenience methods for testing/debugging
     def set_pin(self, pin: int, level: PinLevel) -> None:
         """Set a pin directly (simulate external input)."""
-        if not 0 <= pin < self._pin_count:
+        if pin not in self._valid_pins:
             raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
-        current = self._data_reg.value
-        if level == PinLevel.HIGH:
-            current |= 1 << pin
+        data_reg = self._data_reg
+        if level == HIGH_INT:
+            data_reg.value |= self._pin_bits[pin]
         else:
-            current &= ~(1 << pin)
-        self._data_reg.value = current
+            data_reg.value &= self._pin_clear[pin]
 
     def get_pin(self, pin: int) -> PinLevel:
         """Get the state of a pin."""
-        if not 0 <= pin < self._pin_count:
+        if pin not in self._valid_pins:
             raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
         value = self._data_reg.value
-        return PinLevel((value >> pin) & 1)
+        return PIN_LEVELS[(value >> pin) & 1]
+
+    def set_pins_mask(self, set_mask: int, clear_mask: int) -> None:
+        """Drive several pins at once (batch form of set_pin).
+
+        Pins in set_mask go high, pins in clear_mask go low (clear wins when
+        a pin is in both). Bits outside the port's data mask are ignored.
+        """
+        data_mask = self._data_mask
+        current = self._data_reg.value | (set_mask & data_mask)
+        self._data_reg.value = current & ~(clear_mask & data_mask)
+
+    def read_pins_mask(self, mask: int) -> int:
+        """Return the state of the pins selected by mask."""
+        return self._data_reg.value & mask
+
+    def get_port_state(self) -> int:
+        """Get the entire port state (DATA value)."""
+        return self._data_reg.value
 
     def get_pin_mode(self, pin: int) -> PinMode:
         """Determine pin mode from DIR and AFSEL."""
-        if not 0 <= pin < 8:
-            raise ValueError(f"Invalid pin {pin}; must be 0-7")
-
-        dir_val = self._dir_reg.value & self._data_mask
-        afsel_val = self._afsel_reg.value & self._data_mask
-        bit = 1 << pin
+        if pin not in self._valid_pins:
+            raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
-        if dir_val & bit:
+        # Modes are stored packed in the DIR/AFSEL bitfields; a valid pin's
+        # bit always lies inside data_mask, so no extra masking is needed.
+        bit = self._pin_bits[pin]
+        if self._dir_reg.value & bit:
             return PinMode.OUTPUT
-        if afsel_val & bit:
+        if self._afsel_reg.value & bit:
             return PinMode.ALTERNATE
         return PinMode.INPUT
 
     def set_pin_mode(self, pin: int, mode: PinMode) -> None:
         """Set pin mode by updating DIR and AFSEL."""
-        if not 0 <= pin < self._pin_count:
+        if pin not in self._valid_pins:
             raise ValueError(f"Invalid pin {pin}; must be 0-{self._pin_count - 1}")
 
+        dir_on, afsel_on = _PIN_MODE_BITS.get(mode, _INPUT_MODE_BITS)
         dir_val = self._dir_reg.value & self._data_mask
         afsel_val = self._afsel_reg.value & self._data_mask
-        bit = 1 << pin
-
-        if mode == PinMode.OUTPUT:
-            dir_val |= bit
-            afsel_val &= ~bit
-        elif mode == PinMode.ALTERNATE:
-            dir_val &= ~bit
-            afsel_val |= bit
-        else:  # INPUT
-            dir_val &= ~bit
-            afsel_val &= ~bit
+        bit = self._pin_bits[pin]
+        clear = self._pin_clear[pin]
+
+        dir_val = (dir_val | bit) if dir_on else (dir_val & clear)
+        afsel_val = (afsel_val | bit) if afsel_on else (afsel_val & clear)
 
         self._dir_reg.value = dir_val
         self._afsel_reg.value = afsel_val
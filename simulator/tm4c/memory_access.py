@@ -30,8 +30,51 @@ Register offsets (from TM4C123 datasheet):
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Final, Mapping
+
 from simulator.interfaces.memory_access import MemoryAccessModel
 
+# Regular control registers (standard offset mapping, outside masked window)
+_CONTROL_REGISTERS: Final[Mapping[int, str]] = MappingProxyType(
+    {
+        0x400: "DIR",
+        0x404: "IS",
+        0x408: "IBE",
+        0x40C: "IEV",
+        0x410: "IM",
+        0x414: "RIS",
+        0x418: "MIS",  # Read-only
+        0x41C: "ICR",  # Write-only
+        0x420: "AFSEL",
+        0x500: "DEN",
+    }
+)
+
+_CONTROL_ADDRESSES: Final[Mapping[str, int]] = MappingProxyType(
+    {v: k for k, v in _CONTROL_REGISTERS.items()}
+)
+
+# Decodable span past the port base, and the last offset of the masked window
+_DECODE_SPAN = 0x600
+_MASKED_DATA_END = 0x3FC
+
+
+def _decode_entry(offset: int) -> tuple[str, int] | None:
+    """Decode a single port-relative offset (used to build _DECODE_TABLE)."""
+    if offset <= _MASKED_DATA_END:
+        return ("DATA_MASKED", offset)
+    register_name = _CONTROL_REGISTERS.get(offset)
+    if register_name is None:
+        return None
+    return (register_name, offset)
+
+
+# Offset -> decode result, so decoding is one range check and one index
+_DECODE_TABLE: Final[tuple[tuple[str, int] | None, ...]] = tuple(
+    _decode_entry(offset) for offset in range(_DECODE_SPAN)
+)
+
 
 class TM4C123BitBandedAccessModel(MemoryAccessModel):
     """Bit-banded addressing for TM4C123 GPIO.
@@ -46,21 +89,7 @@ class TM4C123BitBandedAccessModel(MemoryAccessModel):
     Regular control registers (DIR, AFSEL, etc.) use standard offset mapping.
     """
 
-    # Regular control registers (standard offset mapping, outside masked window)
-    _CONTROL_REGISTERS = {
-        0x400: "DIR",
-        0x404: "IS",
-        0x408: "IBE",
-        0x40C: "IEV",
-        0x410: "IM",
-        0x414: "RIS",
-        0x418: "MIS",  # Read-only
-        0x41C: "ICR",  # Write-only
-        0x420: "AFSEL",
-        0x500: "DEN",
-    }
-
-    _CONTROL_ADDRESSES = {v: k for k, v in _CONTROL_REGISTERS.items()}
+    __slots__ = ("gpio_base", "num_pins", "_num_pins_mask", "_masked_data_size")
 
     def __init__(self, gpio_base: int, num_pins: int = 8):
         """Initialize with GPIO port base address.
@@ -87,23 +116,14 @@ class TM4C123BitBandedAccessModel(MemoryAccessModel):
             - Standard register name for control registers (DIR, AFSEL, etc.)
             Or None if address is invalid
         """
-        if address < self.gpio_base or address >= self.gpio_base + 0x600:
-            return None
-
         offset = address - self.gpio_base
+        if not 0 <= offset < _DECODE_SPAN:
+            return None
 
-        # Masked DATA window: 0x00-0x3FC
-        if 0 <= offset <= 0x3FC:
-            # Address encodes bit information: (offset >> 2) & 0x7 = bit_index
-            # Return both the register name and the offset
-            # Caller can decode bit index if needed: bit_index = (offset >> 2) & (num_pins - 1)
-            return ("DATA_MASKED", offset)
-
-        # Control registers: standard mapping outside masked window
-        if offset in self._CONTROL_REGISTERS:
-            return (self._CONTROL_REGISTERS[offset], offset)
-
-        return None
+        # Masked DATA window (0x00-0x3FC): address encodes bit information,
+        # (offset >> 2) & (num_pins - 1) = bit_index. Control registers use
+        # standard mapping outside the window.
+        return _DECODE_TABLE[offset]
 
     def encode_register_address(self, register_name: str) -> int:
         """Convert register name to absolute address.
@@ -112,12 +132,12 @@ class TM4C123BitBandedAccessModel(MemoryAccessModel):
         For control registers, returns their fixed address.
         """
         if register_name in {"DATA", "DATA_MASKED"}:
-            return self.gpio_base + 0x3FC  # Full access mask
-
-        if register_name in self._CONTROL_ADDRESSES:
-            return self.gpio_base + self._CONTROL_ADDRESSES[register_name]
+            return self.gpio_base + _MASKED_DATA_END  # Full access mask
 
-        raise ValueError(f"Unknown register: {register_name}")
+        reg_offset = _CONTROL_ADDRESSES.get(register_name)
+        if reg_offset is None:
+            raise ValueError(f"Unknown register: {register_name}")
+        return self.gpio_base + reg_offset
 
     @property
     def description(self) -> str:
@@ -3,7 +3,8 @@
 import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, NamedTuple, Optional, Union
 
 import yaml  # type: ignore[import-untyped]
 
@@ -24,8 +25,13 @@ class MemoryConfig:
     bitband_periph_size: int
 
 
-@dataclass(frozen=True)
-class Tm4cGpioOffsets:
+class Tm4cGpioOffsets(NamedTuple):
+    """TM4C GPIO register offsets.
+
+    A NamedTuple rather than a dataclass: offsets are read on every MMIO
+    access and tuple-slot attribute access is cheaper than instance dicts.
+    """
+
     data: int
     dir: int
     den: int
@@ -41,8 +47,9 @@ class Tm4cGpioOffsets:
     afsel: int
 
 
-@dataclass(frozen=True)
-class Stm32GpioOffsets:
+class Stm32GpioOffsets(NamedTuple):
+    """STM32 GPIO register offsets (NamedTuple, see Tm4cGpioOffsets)."""
+
     idr: int
     odr: int
     bsrr: int
@@ -51,7 +58,7 @@ class Stm32GpioOffsets:
 @dataclass(frozen=True)
 class Tm4cGpioConfig:
     kind: Literal["tm4c123"]
-    ports: dict[str, int]
+    ports: Mapping[str, int]
     offsets: Tm4cGpioOffsets
     port_size: int
 
@@ -59,7 +66,7 @@ class Tm4cGpioConfig:
 @dataclass(frozen=True)
 class Stm32GpioConfig:
     kind: Literal["stm32"]
-    ports: dict[str, int]
+    ports: Mapping[str, int]
     offsets: Stm32GpioOffsets
     port_size: int
 
@@ -70,19 +77,27 @@ GpioConfig = Union[Tm4cGpioConfig, Stm32GpioConfig]
 @dataclass(frozen=True)
 class SysCtlConfig:
     base: int
-    registers: dict[str, int]
+    registers: Mapping[str, int]
 
 
 @dataclass(frozen=True)
 class PinsConfig:
-    pin_masks: dict[str, int]
-    leds: dict[str, int]
-    switches: dict[str, int] = field(default_factory=dict)
+    pin_masks: Mapping[str, int]
+    leds: Mapping[str, int]
+    switches: Mapping[str, int] = field(default_factory=dict)
+    # OR of all pin_masks (the GPIO data mask), derived once at construction
+    data_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        mask = 0
+        for value in self.pin_masks.values():
+            mask |= value
+        object.__setattr__(self, "data_mask", mask)
 
 
 @dataclass(frozen=True)
 class NvicConfig:
-    irq: dict[str, int]
+    irq: Mapping[str, int]
     irq_offset: int
 
 
@@ -96,7 +111,7 @@ class SimulatorConfig:
 
 
 # Configuration cache with thread safety
-_LOADER_CACHE: dict[str, SimulatorConfig] = {}
+_LOADER_CACHE: dict[tuple[str, Optional[str]], SimulatorConfig] = {}
 _CACHE_LOCK = threading.RLock()
 
 
@@ -119,10 +134,19 @@ def _load_yaml_file(path: Path) -> dict[str, Any]:
     return raw
 
 
+def _int_mapping(raw: Mapping[str, Any]) -> Mapping[str, int]:
+    """Convert a name -> number section to a read-only mapping of ints.
+
+    Parsed configs are cached and shared between boards, so their nested
+    mappings are read-only views rather than dicts anyone could mutate.
+    """
+    return MappingProxyType({k: int(v) for k, v in raw.items()})
+
+
 def _build_nvic_cfg(nvic_raw: dict[str, Any]) -> NvicConfig:
     """Convert NVIC section to NVIC_Config with defaults."""
     return NvicConfig(
-        irq={k: int(v) for k, v in nvic_raw.get("irq", {}).items()},
+        irq=_int_mapping(nvic_raw.get("irq", {})),
         irq_offset=int(nvic_raw.get("irq_offset", 16)),
     )
 
@@ -152,12 +176,12 @@ def _parse_simulator_cfg_from_dict(raw: dict[str, Any]) -> SimulatorConfig:
             gpio=_build_gpio_config(gpio),
             sysctl=SysCtlConfig(
                 base=int(sysctl["base"]),
-                registers={k: int(v) for k, v in sysctl["registers"].items()},
+                registers=_int_mapping(sysctl["registers"]),
             ),
             pins=PinsConfig(
-                pin_masks={k: int(v) for k, v in pins["pin_masks"].items()},
-                leds={k: int(v) for k, v in pins["leds"].items()},
-                switches={k: int(v) for k, v in pins.get("switches", {}).items()},
+                pin_masks=_int_mapping(pins["pin_masks"]),
+                leds=_int_mapping(pins["leds"]),
+                switches=_int_mapping(pins.get("switches", {})),
             ),
             nvic=_build_nvic_cfg(nvic_raw),
         )
@@ -172,7 +196,7 @@ def _parse_simulator_cfg_from_dict(raw: dict[str, Any]) -> SimulatorConfig:
 
 def _build_gpio_config(gpio_raw: dict[str, Any]) -> GpioConfig:
     kind = gpio_raw.get("kind")
-    ports = {k: int(v) for k, v in gpio_raw["ports"].items()}
+    ports = _int_mapping(gpio_raw["ports"])
     offsets_raw = gpio_raw["offsets"]
     port_size = int(gpio_raw["port_size"])
 
@@ -292,19 +316,22 @@ def load_config(board_name: str, path: Optional[str] = None) -> SimulatorConfig:
     return _parse_simulator_cfg_from_dict(raw=raw)
 
 
-def get_config(board_name: str) -> SimulatorConfig:
+def get_config(board_name: str, path: Optional[str] = None) -> SimulatorConfig:
     """Return the loaded config for board_name, loading and caching if necessary.
 
-    Configs are cached per board_name; repeated calls for the same board
-    return the cached instance without re-reading the YAML file.
+    Configs are cached per (board_name, path); repeated calls for the same
+    pair return the cached instance without re-reading the YAML file. The
+    returned config is frozen down to its nested mappings (read-only
+    views), so boards can share it.
 
     THREAD SAFETY: This function is thread-safe. Multiple threads can
     safely call this concurrently.
     """
+    key = (board_name, path)
     with _CACHE_LOCK:
-        if board_name not in _LOADER_CACHE:
-            _LOADER_CACHE[board_name] = load_config(board_name=board_name)
-        return _LOADER_CACHE[board_name]
+        if key not in _LOADER_CACHE:
+            _LOADER_CACHE[key] = load_config(board_name=board_name, path=path)
+        return _LOADER_CACHE[key]
 
 
 def clear_config_cache() -> None:
@@ -64,6 +64,18 @@ def test_ram_memory_read_write_reset_and_bounds():
     assert ram.read(0x20000000, 4) == 0
 
 
+def test_ram_memory_truncates_and_handles_uncommon_sizes():
+    ram = RamMemory(AddressRange(0x20000000, 8))
+    ram.write(0x20000000, 2, -1)
+    assert ram.read(0x20000000, 4) == 0xFFFF
+    ram.write(0x20000001, 1, 0x1AB)
+    assert ram.read(0x20000000, 2) == 0xABFF
+
+    ram.write(0x20000004, 3, 0x11223344)
+    assert ram.read(0x20000004, 3) == 0x223344
+    assert ram.read_block(0x20000004, 4) == b"\x44\x33\x22\x00"
+
+
 def test_bitband_translate_and_errors():
     alias = AddressRange(0x22000000, 0x20)
     target = AddressRange(0x20000000, 0x10)
@@ -1,6 +1,8 @@
+from unittest.mock import patch
+
 from simulator.core.clock import Clock
 from simulator.core.interrupt_controller import InterruptController
-from simulator.core.peripheral import BasePeripheral
+from simulator.core.peripheral import BasePeripheral, needs_clock_tick
 
 
 class DummyPeripheral(BasePeripheral):
@@ -49,3 +51,27 @@ def test_base_peripheral_emit_interrupt():
 def test_base_peripheral_emit_without_controller_no_error():
     periph = DummyPeripheral()
     periph.emit_interrupt(vector=1)
+
+
+def test_register_aliases_forward_to_current_read_write():
+    periph = DummyPeripheral()
+    with patch.object(DummyPeripheral, "read", return_value=99):
+        assert periph.read_register(0, 4) == 99
+    with patch.object(DummyPeripheral, "write") as write:
+        periph.write_register(0, 4, 7)
+    write.assert_called_once_with(0, 4, 7)
+
+
+def test_needs_clock_tick_skips_inherited_noop():
+    class Timed(DummyPeripheral):
+        def tick(self, cycles: int = 1) -> None:
+            pass
+
+    class DuckTyped:
+        def tick(self, cycles: int = 1) -> None:
+            pass
+
+    assert not needs_clock_tick(DummyPeripheral())
+    assert needs_clock_tick(Timed())
+    assert needs_clock_tick(DuckTyped())
+    assert not needs_clock_tick(object())
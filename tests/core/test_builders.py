@@ -1,7 +1,10 @@
 from simulator.core.builders import (
     create_address_space_from_config,
     create_cpu_for_address_space,
+    wire_clock_and_interrupts,
 )
+from simulator.core.clock import Clock
+from simulator.core.interrupt_controller import InterruptController
 from simulator.core.memmap import AddressSpace
 from simulator.utils.config_loader import load_config
 
@@ -50,3 +53,26 @@ def test_create_cpu_for_address_space(monkeypatch):
 
     # CPU instance returned
     assert cpu.address_space is addr_space
+
+
+def test_wire_clock_and_interrupts_ticks_only_timed_peripherals():
+    class Timed:
+        def __init__(self):
+            self.ctrl = None
+
+        def tick(self, cycles: int = 1) -> None:
+            pass
+
+        def attach_interrupt_controller(self, ctrl) -> None:
+            self.ctrl = ctrl
+
+    clock = Clock()
+    ctrl = InterruptController(clock)
+    cpu = object()
+    timed, passive = Timed(), object()
+
+    wire_clock_and_interrupts(clock, ctrl, cpu, [timed, passive])
+
+    assert clock._subscribers == [cpu, timed]
+    assert ctrl._subscribers == [timed, passive]
+    assert timed.ctrl is ctrl
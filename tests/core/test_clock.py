@@ -90,3 +90,38 @@ def test_clock_negative_cycles():
     clock = Clock()
     with pytest.raises(ValueError):
         clock.tick(-1)
+
+
+def test_clock_subscribe_many_dispatches_in_order_without_duplicates():
+    clock = Clock()
+    first = SubscriberWithCycles()
+    second = SubscriberWithStepOnly()
+    clock.subscribe(first)
+    clock.subscribe_many([first, second, object()])
+    clock.tick(2)
+
+    assert first.cycles == [2]
+    assert second.calls == 2
+    assert clock._subscribers[:2] == [first, second]
+    assert len(clock._dispatch) == 2
+
+
+class SubscriberRaisingTypeError:
+    def __init__(self, method: str):
+        self.calls = 0
+        setattr(self, method, self._fail)
+
+    def _fail(self, cycles: int = 1) -> None:
+        self.calls += 1
+        raise TypeError("inner")
+
+
+@pytest.mark.parametrize("method", ["tick", "step"])
+def test_clock_tick_propagates_subscriber_type_error_without_retry(method):
+    clock = Clock()
+    sub = SubscriberRaisingTypeError(method)
+    clock.subscribe(sub)
+
+    with pytest.raises(TypeError, match="^inner$"):
+        clock.tick(3)
+    assert sub.calls == 1
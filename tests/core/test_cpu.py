@@ -148,6 +148,7 @@ def test_cortexm_reset_success():
 
     engine = DummyEngine()
     cpu = cpu_mod.CortexM(engine, addr_space)
+    assert not hasattr(cpu, "__dict__")
     cpu.reset()
 
     assert engine.uc.regs[cpu_mod.UC_ARM_REG_MSP] == msp
@@ -1,5 +1,8 @@
+import pytest
+
 from simulator.core.clock import Clock
 from simulator.core.interrupt_controller import InterruptController
+from simulator.interfaces.interrupt_controller import InterruptEvent
 
 
 class DummyCpu:
@@ -27,10 +30,13 @@ def test_interrupt_controller_notify_and_timestamp():
 
 def test_interrupt_controller_reset_clears_pending():
     ctrl = InterruptController()
+    assert ctrl.has_pending() is False
     ctrl.notify(source="timer", vector=None)
     assert len(ctrl._pending) == 1
+    assert ctrl.has_pending() is True
     ctrl.reset()
     assert len(ctrl._pending) == 0
+    assert ctrl.has_pending() is False
 
 
 def test_interrupt_controller_subscribe_no_duplicates():
@@ -39,3 +45,21 @@ def test_interrupt_controller_subscribe_no_duplicates():
     ctrl.subscribe(obj)
     ctrl.subscribe(obj)
     assert len(ctrl._subscribers) == 1
+
+
+def test_interrupt_event_has_no_instance_dict():
+    event = InterruptController().notify(source="gpio", vector=1)
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.vector = 2
+
+
+def test_interrupt_event_uses_tuple_equality():
+    source = object()
+    event = InterruptEvent(source=source, vector=1, timestamp=5)
+    assert event == InterruptEvent(source, 1, 5)
+    assert event == (source, 1, 5)
+    assert hash(event) == hash((source, 1, 5))
+    assert event != InterruptEvent(source, 2, 5)
+    with pytest.raises(TypeError):
+        _ = event < InterruptEvent(object(), 1, 5)
@@ -44,12 +44,31 @@ def _make_address_space() -> AddressSpace:
     return AddressSpace(flash, sram, mmio, [bitband, bitband_periph])
 
 
+def _make_wide_mmio_address_space() -> AddressSpace:
+    # Mirrors STM32C031, whose MMIO window spans the peripheral bitband alias
+    flash = FlashMemory(AddressRange(0x00000000, 0x100))
+    sram = RamMemory(AddressRange(0x20000000, 0x100))
+    mmio = PeripheralWindow(AddressRange(0x40000000, 0x10000000))
+    bitband = BitBandRegion(
+        AddressRange(0x42000000, 0x200),
+        AddressRange(0x40000000, 0x100),
+        target_is_peripheral=True,
+    )
+    return AddressSpace(flash, sram, mmio, [bitband])
+
+
 def test_validate_access_size_and_alignment():
     addr_space = _make_address_space()
     with pytest.raises(MemoryAccessError):
         addr_space.read(0x20000000, 3)
     with pytest.raises(MemoryAlignmentError):
         addr_space.read(0x20000001, 4)
+    with pytest.raises(MemoryAccessError):
+        addr_space.write(0x20000000, 8, 0)
+    with pytest.raises(MemoryAlignmentError):
+        addr_space.write(0x20000002, 4, 0)
+    addr_space.write(0x20000003, 1, 0xAB)
+    assert addr_space.read(0x20000003, 1) == 0xAB
 
 
 def test_flash_read_and_write_error():
@@ -107,6 +126,33 @@ def test_bitband_peripheral_read_write():
     assert (periph.word & (1 << 1)) == 0
 
 
+def test_bitband_alias_wins_inside_a_wider_mmio_window():
+    addr_space = _make_wide_mmio_address_space()
+    periph = DummyPeripheral()
+    after_alias = DummyPeripheral()
+    addr_space.register_peripheral(0x40000000, 0x100, periph)
+    addr_space.register_peripheral(0x42000200, 0x100, after_alias)
+
+    addr_space.write(0x42000000 + 2 * 4, 4, 1)
+    assert periph.word == 0b100
+    after_alias.word = 0x77
+    assert addr_space.read(0x42000200, 4) == 0x77
+
+
+def test_mmio_cache_never_shadows_a_bitband_alias():
+    addr_space = _make_wide_mmio_address_space()
+    target = DummyPeripheral()
+    straddling = DummyPeripheral()
+    addr_space.register_peripheral(0x40000000, 0x100, target)
+    addr_space.register_peripheral(0x42000000, 0x1000, straddling)
+    straddling.word = 0x77
+
+    # Same cache page as the alias below, but past the end of the alias
+    assert addr_space.read(0x42000300, 4) == 0x77
+    target.word = 0b10
+    assert addr_space.read(0x42000000 + 1 * 4, 4) == 1
+
+
 def test_bitband_peripheral_missing_mapping_raises():
     addr_space = _make_address_space()
     alias_addr = 0x42000000 + (0x00 * 32) + (1 * 4)
@@ -141,6 +187,19 @@ def test_find_peripheral_no_match_and_resolve_none():
     assert addr_space.resolve_region(0x60000000) is None
 
 
+def test_find_peripheral_cache_distinguishes_peripherals_in_same_page():
+    addr_space = _make_address_space()
+    periph_a = DummyPeripheral()
+    periph_b = DummyPeripheral()
+    addr_space.register_peripheral(0x40000000, 0x10, periph_a)
+    assert addr_space.find_peripheral(0x40000004).peripheral is periph_a
+    # Cached entry for the page must not satisfy lookups outside its range
+    assert addr_space.find_peripheral(0x40000020) is None
+    addr_space.register_peripheral(0x40000020, 0x10, periph_b)
+    assert addr_space.find_peripheral(0x40000024).peripheral is periph_b
+    assert addr_space.find_peripheral(0x40000008).peripheral is periph_a
+
+
 def test_register_peripheral_overlap_with_next():
     addr_space = _make_address_space()
     periph_a = DummyPeripheral()
@@ -150,6 +209,34 @@ def test_register_peripheral_overlap_with_next():
         addr_space.register_peripheral(0x40000000, 0x100, periph_b)
 
 
+def test_register_peripherals_batch_resolves_each():
+    addr_space = _make_address_space()
+    periph_a = DummyPeripheral()
+    periph_b = DummyPeripheral()
+    addr_space.register_peripherals(
+        [(0x40000080, 0x80, periph_b), (0x40000000, 0x80, periph_a)]
+    )
+    assert addr_space.find_peripheral(0x40000010).peripheral is periph_a
+    assert addr_space.find_peripheral(0x40000090).peripheral is periph_b
+
+    periph_a.word = periph_b.word = 0x55
+    addr_space.reset()
+    assert periph_a.word == periph_b.word == 0
+
+
+def test_register_peripherals_overlap_leaves_registry_unchanged():
+    addr_space = _make_address_space()
+    with pytest.raises(ValueError):
+        addr_space.register_peripherals(
+            [
+                (0x40000000, 0x80, DummyPeripheral()),
+                (0x40000040, 0x80, DummyPeripheral()),
+            ]
+        )
+    assert addr_space.find_peripheral(0x40000000) is None
+    assert addr_space.find_peripheral(0x40000090) is None
+
+
 def test_flash_write_path_return_line():
     class WritableFlash(FlashMemory):
         def write(self, address: int, size: int, value: int) -> None:
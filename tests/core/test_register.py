@@ -1,6 +1,7 @@
 import pytest
 
 from simulator.core.register import (
+    MaskedWriteRegister,
     ReadOnlyRegister,
     RegisterDescriptor,
     RegisterFile,
@@ -51,6 +52,28 @@ def test_write_only_register_reads_reset_value():
     assert reg.read(4) == 0x1111
 
 
+def test_masked_write_register_keeps_bits_outside_mask():
+    reg = MaskedWriteRegister(0x00, 4, 0xF00, write_mask=0xFF)
+    reg.write(4, 0xFFFF)
+    assert reg.read(4) == 0xFFF
+    reg.write(1, 0x00)
+    assert reg.read(4) == 0xF00
+    reg.reset()
+    assert reg.value == 0xF00
+
+
+def test_register_invalid_access_size_raises_value_error():
+    reg = SimpleRegister(offset=0x00, width=4)
+    masked = MaskedWriteRegister(0x00, 4, write_mask=0xFF)
+    with pytest.raises(ValueError, match="Invalid access size 3"):
+        reg.read(3)
+    with pytest.raises(ValueError, match="Invalid access size 3"):
+        reg.write(3, 0)
+    with pytest.raises(ValueError, match="Invalid access size 8"):
+        masked.write(8, 0)
+    assert reg.value == 0 and masked.value == 0
+
+
 def test_register_file_add_duplicate_and_defaults():
     rf = RegisterFile()
     reg = SimpleRegister(offset=0x00, width=4, reset_value=0x0)
@@ -88,3 +111,24 @@ def test_register_file_invalid_access_size():
     rf = RegisterFile()
     with pytest.raises(ValueError):
         rf.read(0x00, 3)
+
+
+def test_register_file_dense_dispatch_bounds():
+    rf = RegisterFile(size=0x10)
+    low = SimpleRegister(offset=0x04, width=4, reset_value=0x11)
+    high = SimpleRegister(offset=0x40, width=4, reset_value=0x22)  # beyond size
+    rf.add(low)
+    rf.add(high)
+
+    assert rf.read(0x04, 4) == 0x11
+    assert rf.read(0x40, 4) == 0x22
+    assert rf.read(0x08, 4, default_reset=0x7) == 0x7  # undefined, in window
+    assert rf.read(0x400, 4) == 0  # past the table
+    assert rf.read(-4, 4) == 0  # negative offsets never wrap around
+
+    rf.write(-4, 4, 0xFF)
+    rf.write(0x400, 4, 0xFF)
+    assert low.read(4) == 0x11
+
+    with pytest.raises(ValueError):
+        rf.add(SimpleRegister(offset=-4, width=4))
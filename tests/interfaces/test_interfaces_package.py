@@ -0,0 +1,21 @@
+import pytest
+
+import simulator.interfaces as interfaces
+from simulator.interfaces.board import Board
+from simulator.interfaces.cpu import ICPU
+
+
+def test_lazy_exports_resolve_to_defining_modules():
+    assert interfaces.Board is Board
+    assert interfaces.ICPU is ICPU
+    for name in interfaces.__all__:
+        assert getattr(interfaces, name) is not None
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        _ = interfaces.DoesNotExist
+
+
+def test_dir_lists_public_names():
+    assert set(interfaces.__all__).issubset(dir(interfaces))
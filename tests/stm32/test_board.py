@@ -42,6 +42,17 @@ def test_stm32_board_wiring_and_step(monkeypatch):
     periph = next(iter(board.peripherals.values()))
     assert getattr(periph, "_interrupt_controller", None) is board.interrupt_ctrl
 
+    # GPIO/SYSCTL have no timed state, so only the CPU is clocked
+    assert board.clock._subscribers == [dummy_cpu]
+
+
+def test_stm32_boards_share_parsed_config(monkeypatch):
+    monkeypatch.setattr(
+        "simulator.stm32.board.create_cpu_for_address_space",
+        lambda _addr: DummyCPU(),
+    )
+    assert STM32F4Board().config is STM32F4Board().config
+
 
 def test_stm32_board_pin_mask_and_gpio_kind_errors(monkeypatch):
     dummy_cpu = DummyCPU()
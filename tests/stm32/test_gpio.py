@@ -26,6 +26,26 @@ def test_bsrr_sets_and_resets_bits(gpio_cfg_with_mask):
     assert gpio.get_port_state() == 0b00000001
 
 
+def test_bsrr_combined_set_and_reset_word(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0b1010)
+    # Set pin 0, reset pins 1 and 3 in a single write
+    gpio.write(gpio_cfg.offsets.bsrr, 4, (0b1010 << 16) | 0b0001)
+    assert gpio.get_port_state() == 0b0001
+    assert gpio.read(gpio_cfg.offsets.bsrr, 4) == 0
+
+
+def test_writes_outside_port_window_are_ignored(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0003)
+    gpio.write(gpio_cfg.port_size + 4, 4, 0xFFFFFFFF)
+    gpio.write(-4, 4, 0xFFFFFFFF)
+    assert gpio.get_port_state() == 0x0003
+    # ODR keeps only the data bits of a full-word write
+    gpio.write(gpio_cfg.offsets.odr, 4, 0xFFFF0000 | 0x0005)
+    assert gpio.get_port_state() == 0x0005 & data_mask
+
+
 def test_gpio_reset_and_data_mask_validation(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
     initial = 0x00FF
@@ -44,6 +64,15 @@ def test_odr_write_and_read(gpio_cfg_with_mask):
     assert gpio.read(gpio_cfg.offsets.odr, 4) == 0x00F0
 
 
+def test_odr_byte_access_touches_low_byte_only(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0000)
+    gpio.write(gpio_cfg.offsets.odr, 4, 0x0300)
+    gpio.write(gpio_cfg.offsets.odr, 1, 0xFF05)
+    assert gpio.read(gpio_cfg.offsets.odr, 4) == 0x0305 & data_mask
+    assert gpio.read(gpio_cfg.offsets.odr, 1) == 0x05 & data_mask
+
+
 def test_idr_reflects_input_pins(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
     gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0000)
@@ -54,6 +83,12 @@ def test_idr_reflects_input_pins(gpio_cfg_with_mask):
     gpio.set_pin(3, PinLevel.LOW)
     assert gpio.read(gpio_cfg.offsets.idr, 4) & (1 << 3) == 0
 
+    # Driving one pin leaves the others untouched
+    gpio.set_pin(0, PinLevel.HIGH)
+    gpio.set_pin(5, PinLevel.HIGH)
+    gpio.set_pin(0, PinLevel.LOW)
+    assert gpio.read(gpio_cfg.offsets.idr, 4) == 1 << 5
+
 
 def test_idr_defaults_to_odr_when_no_external_inputs(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
@@ -69,6 +104,19 @@ def test_bsrr_requires_word_access(gpio_cfg_with_mask):
         gpio.write(gpio_cfg.offsets.bsrr, 2, 0xFFFF)
 
 
+def test_invalid_access_size_raises_value_error_on_every_offset(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0000)
+    offsets = gpio_cfg.offsets
+    for offset in (offsets.odr, offsets.bsrr, 0x00):
+        with pytest.raises(ValueError, match="Invalid access size 3"):
+            gpio.write(offset, 3, 0x1)
+    for offset in (offsets.idr, offsets.odr, 0x00):
+        with pytest.raises(ValueError, match="Invalid access size 3"):
+            gpio.read(offset, 3)
+    assert gpio.read(offsets.odr, 4) == 0
+
+
 def test_invalid_pin_raises(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
     gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0000)
@@ -78,10 +126,20 @@ def test_invalid_pin_raises(gpio_cfg_with_mask):
         gpio.get_pin(32)
 
 
+def test_idr_narrow_reads_mask_to_access_width(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0180)
+    assert gpio.read(gpio_cfg.offsets.idr, 1) == 0x80
+    gpio.set_pins_mask(0x0300, 0)
+    assert gpio.read(gpio_cfg.offsets.idr, 1) == 0x80
+    assert gpio.read(gpio_cfg.offsets.idr, 2) == 0x0380 & data_mask
+
+
 def test_get_pin_valid(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
     gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0001)
-    assert gpio.get_pin(0) == PinLevel.HIGH
+    assert gpio.get_pin(0) is PinLevel.HIGH
+    assert gpio.get_pin(1) is PinLevel.LOW
 
 
 def test_get_port_state_returns_odr(gpio_cfg_with_mask):
@@ -89,3 +147,28 @@ def test_get_port_state_returns_odr(gpio_cfg_with_mask):
     gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0000)
     gpio.write(gpio_cfg.offsets.odr, 4, 0x00AA)
     assert gpio.get_port_state() == 0x00AA
+
+
+def test_idr_drive_bits_starts_from_odr(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0011)
+    idr = gpio._idr
+    idr.drive_bits(0b0100, 0)
+    assert idr.get_external_input() == 0x0015
+    idr.drive_bits(0, 0x0001)
+    assert gpio.read(gpio_cfg.offsets.idr, 4) == 0x0014
+
+
+def test_set_and_read_pins_mask(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x00F0)
+    gpio.set_pins_mask(0x0003, 0x0030)
+    assert gpio.read(gpio_cfg.offsets.idr, 4) == 0x00C3
+    assert gpio.read_pins_mask(0x00FF) == 0x00F0  # ODR is unaffected
+
+
+def test_gpio_and_registers_use_slots(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = STM32GPIO(gpio_cfg, data_mask=data_mask)
+    for obj in (gpio, gpio._odr, gpio._idr, gpio._bsrr):
+        assert not hasattr(obj, "__dict__")
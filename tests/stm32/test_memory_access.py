@@ -12,6 +12,8 @@ def test_stm32_direct_access_decode_encode():
 
     assert model.decode_register_access(base - 4, 4) is None
     assert model.decode_register_access(base + 0x02, 4) is None
+    assert model.decode_register_access(base + 0x100, 4) is None
+    assert model.decode_register_access(base + 0x24, 4) == ("AFRH", 0x24)
     assert model.encode_register_address("ODR") == base + 0x14
 
     with pytest.raises(ValueError):
@@ -29,6 +29,7 @@ def test_tm4c_board_wiring_and_step(monkeypatch):
 
     board = TM4C123Board()
     assert board.name == "TM4C123"
+    assert not hasattr(board, "__dict__")
     assert board.cpu is dummy_cpu
     assert board.peripherals
     assert board.memory_map is board.address_space
@@ -42,6 +43,18 @@ def test_tm4c_board_wiring_and_step(monkeypatch):
     assert getattr(periph, "_interrupt_controller", None) is board.interrupt_ctrl
 
 
+def test_tm4c_boards_share_parsed_config(monkeypatch):
+    monkeypatch.setattr(
+        "simulator.tm4c.board.create_cpu_for_address_space",
+        lambda _addr: DummyCPU(),
+    )
+    first, second = TM4C123Board(), TM4C123Board()
+    assert first.config is second.config
+    # Shared, so nested mappings must not be mutable through either board
+    with pytest.raises(TypeError):
+        first.config.gpio.ports["GPIOZ"] = 0
+
+
 def test_tm4c_board_pin_mask_and_gpio_kind_errors(monkeypatch):
     dummy_cpu = DummyCPU()
     monkeypatch.setattr(
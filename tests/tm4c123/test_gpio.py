@@ -68,6 +68,21 @@ def test_masked_data_direct_access_and_invalid_size(gpio_cfg_with_mask):
 
     # Out-of-range read returns 0
     assert gpio._data_reg.read_masked(data_base - 4) == 0
+    assert gpio._data_reg.read_masked(data_base + 0x400) == 0
+    with pytest.raises(ValueError):
+        gpio._data_reg.write_masked(data_base + 0x400, 0xFF)
+
+
+def test_masked_data_window_uses_address_bits(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask, initial_value=0x0F)
+    data_base = gpio_cfg.offsets.data
+
+    # Pins 0 and 7 only: pin 0 cleared, pin 7 set, others untouched
+    gpio.write(data_base + (0x81 << 2), 4, 0xFE)
+    assert gpio.read(data_base, 4) == 0x8E & data_mask
+    assert gpio.read(data_base + (0x06 << 2), 4) == 0x06
+    assert gpio.read(data_base + 0x3FC, 4) == 0x8E & data_mask
 
 
 def test_icr_clears_ris(gpio_cfg_with_mask):
@@ -78,6 +93,35 @@ def test_icr_clears_ris(gpio_cfg_with_mask):
     assert gpio._ris_reg.value == 0b00001100
 
 
+def test_control_register_dispatch(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask)
+    offsets = gpio_cfg.offsets
+
+    # Control registers keep only the port's data bits
+    gpio.write(offsets.dir, 4, 0xFFFF00F0)
+    assert gpio.read(offsets.dir, 4) == 0xF0 & data_mask
+
+    # MIS reflects RIS gated by IM and ignores writes
+    gpio._ris_reg.value = 0b0110
+    gpio.write(offsets.im, 4, 0b0011)
+    gpio.write(offsets.mis, 4, 0xFF)
+    assert gpio.read(offsets.mis, 4) == 0b0010
+
+    # Undefined offsets read as zero and still validate the access size
+    assert gpio.read(0x500, 4) == 0
+    with pytest.raises(ValueError):
+        gpio.write(0x500, 3, 0)
+
+    # Defined control offsets reject bad sizes with the same error
+    for offset in (offsets.dir, offsets.icr, offsets.mis, 0x500):
+        with pytest.raises(ValueError, match="Invalid access size 3"):
+            gpio.write(offset, 3, 1)
+        with pytest.raises(ValueError, match="Invalid access size 3"):
+            gpio.read(offset, 3)
+    assert gpio.read(offsets.dir, 4) == 0xF0 & data_mask
+
+
 def test_gpio_reset_and_data_mask_validation(gpio_cfg_with_mask):
     gpio_cfg, data_mask = gpio_cfg_with_mask
     gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask, initial_value=0xFF)
@@ -99,6 +143,8 @@ def test_invalid_pin_raises(gpio_cfg_with_mask):
         gpio.get_pin_mode(32)
     with pytest.raises(ValueError):
         gpio.set_pin_mode(32, gpio.get_pin_mode(0))
+    with pytest.raises(ValueError):
+        gpio.get_pin(-1)
 
 
 def test_direct_data_write_and_other_register_read(gpio_cfg_with_mask):
@@ -117,8 +163,9 @@ def test_set_pin_low_and_set_pin_mode_branches(gpio_cfg_with_mask):
     gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask)
 
     gpio.set_pin(0, PinLevel.HIGH)
+    assert gpio.get_pin(0) is PinLevel.HIGH
     gpio.set_pin(0, PinLevel.LOW)
-    assert gpio.get_pin(0) == PinLevel.LOW
+    assert gpio.get_pin(0) is PinLevel.LOW
 
     gpio.set_pin_mode(0, PinMode.OUTPUT)
     assert gpio.get_pin_mode(0) == PinMode.OUTPUT
@@ -126,3 +173,60 @@ def test_set_pin_low_and_set_pin_mode_branches(gpio_cfg_with_mask):
     assert gpio.get_pin_mode(0) == PinMode.ALTERNATE
     gpio.set_pin_mode(0, PinMode.INPUT)
     assert gpio.get_pin_mode(0) == PinMode.INPUT
+
+
+def test_set_pin_and_mode_touch_only_the_selected_pin(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask, initial_value=0xFF)
+
+    gpio.set_pin(2, PinLevel.LOW)
+    assert gpio.read(gpio_cfg.offsets.data, 4) == data_mask & ~0b100
+
+    gpio.write(gpio_cfg.offsets.dir, 4, 0xFF)
+    gpio.set_pin_mode(5, PinMode.INPUT)
+    assert gpio.read(gpio_cfg.offsets.dir, 4) == data_mask & ~(1 << 5)
+
+
+def test_set_pin_low_with_sparse_data_mask_clears_only_that_pin(
+    gpio_cfg_with_mask,
+):
+    gpio_cfg, _ = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=0b10110110)
+
+    gpio.set_pin(0, PinLevel.HIGH)
+    gpio.set_pin(1, PinLevel.LOW)
+    assert gpio.get_pin(0) is PinLevel.HIGH
+    assert gpio.get_port_state() == 0b1
+
+    gpio.write(gpio_cfg.offsets.dir, 4, 0xFF)
+    gpio.set_pin_mode(1, PinMode.INPUT)
+    assert gpio.read(gpio_cfg.offsets.dir, 4) == 0b10110100
+
+
+def test_pull_modes_configure_pin_as_input(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask)
+
+    gpio.set_pin_mode(2, PinMode.OUTPUT)
+    gpio.set_pin_mode(2, PinMode.INPUT_PULLUP)
+    assert gpio.read(gpio_cfg.offsets.dir, 4) == 0
+    assert gpio.read(gpio_cfg.offsets.afsel, 4) == 0
+    assert gpio.get_pin_mode(2) == PinMode.INPUT
+
+
+def test_set_and_read_pins_mask(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask, initial_value=0xF0)
+    gpio.set_pins_mask(0x03, 0x30)
+    assert gpio.read(gpio_cfg.offsets.data, 4) == 0xC3
+    assert gpio.get_port_state() == 0xC3
+    assert gpio.read_pins_mask(0x0F) == 0x03
+    gpio.set_pins_mask(0x01, 0x01)  # clear wins
+    assert gpio.get_pin(0) == PinLevel.LOW
+
+
+def test_gpio_and_registers_use_slots(gpio_cfg_with_mask):
+    gpio_cfg, data_mask = gpio_cfg_with_mask
+    gpio = TM4C123GPIO(gpio_cfg, data_mask=data_mask)
+    for obj in (gpio, gpio._data_reg, gpio._ris_reg, gpio._icr_reg, gpio._dir_reg):
+        assert not hasattr(obj, "__dict__")
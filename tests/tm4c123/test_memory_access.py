@@ -11,6 +11,10 @@ def test_tm4c_bitband_access_decode_encode():
     assert model.decode_register_access(base + 0x400, 4) == ("DIR", 0x400)
     assert model.decode_register_access(base - 4, 4) is None
     assert model.decode_register_access(base + 0x430, 4) is None
+    assert model.decode_register_access(base + 0x3FC, 4) == ("DATA_MASKED", 0x3FC)
+    assert model.decode_register_access(base + 0x500, 4) == ("DEN", 0x500)
+    assert model.decode_register_access(base + 0x5FC, 4) is None
+    assert model.decode_register_access(base + 0x600, 4) is None
 
     assert model.encode_register_address("DATA") == base + 0x3FC
     assert model.encode_register_address("AFSEL") == base + 0x420
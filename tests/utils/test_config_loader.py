@@ -1,4 +1,5 @@
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -78,6 +79,12 @@ class TestGpioOffsets:
         offsets = Stm32GpioOffsets(idr=0x10, odr=0x14, bsrr=0x18)
         assert offsets.idr == 0x10
 
+    def test_offsets_are_immutable_tuples(self):
+        offsets = Stm32GpioOffsets(idr=0x10, odr=0x14, bsrr=0x18)
+        assert tuple(offsets) == (0x10, 0x14, 0x18)
+        with pytest.raises(AttributeError):
+            offsets.idr = 0
+
 
 class TestGetConfigPath:
     def test_get_config_path_default(self):
@@ -163,6 +170,26 @@ class TestParseSimulatorCfgFromDict:
         assert isinstance(cfg.gpio, Tm4cGpioConfig)
         assert cfg.gpio.kind == "tm4c123"
 
+    def test_pins_data_mask_is_or_of_pin_masks(self, valid_config_dict):
+        valid_config_dict["pins"]["pin_masks"] = {"PIN0": 0x01, "PIN5": 0x20}
+        cfg = _parse_simulator_cfg_from_dict(valid_config_dict)
+        assert cfg.pins.data_mask == 0x21
+        assert replace(cfg.pins, pin_masks={}).data_mask == 0
+
+    def test_nested_mappings_are_read_only(self, valid_config_dict):
+        cfg = _parse_simulator_cfg_from_dict(valid_config_dict)
+        for mapping in (
+            cfg.gpio.ports,
+            cfg.sysctl.registers,
+            cfg.pins.pin_masks,
+            cfg.pins.leds,
+            cfg.pins.switches,
+            cfg.nvic.irq,
+        ):
+            with pytest.raises(TypeError):
+                mapping["NEW"] = 1
+        assert cfg.sysctl.registers == {"rcgcgpio": 0x608}
+
     def test_parse_invalid_gpio_kind(self, valid_config_dict):
         valid_config_dict["gpio"]["kind"] = "unknown"
         with pytest.raises(ConfigurationError):
@@ -264,5 +291,14 @@ class TestGetConfig:
                 mock_config = Mock(spec=SimulatorConfig)
                 mock_load.return_value = mock_config
                 result = get_config("tm4c123")
-                mock_load.assert_called_once_with(board_name="tm4c123")
+                mock_load.assert_called_once_with(board_name="tm4c123", path=None)
                 assert result == mock_config
+
+    def test_get_config_caches_per_path(self):
+        with patch("simulator.utils.config_loader._LOADER_CACHE", {}):
+            with patch("simulator.utils.config_loader.load_config") as mock_load:
+                mock_load.side_effect = lambda **_kw: Mock(spec=SimulatorConfig)
+                first = get_config("stm32f4", path="a.yaml")
+                assert get_config("stm32f4", path="a.yaml") is first
+                assert get_config("stm32f4", path="b.yaml") is not first
+                assert mock_load.call_count == 2